@@ -169,6 +169,19 @@ class Header(object):
 
         return
 
+    def set_keywords(self, entries: list):
+        """
+        Set several keywords at once.
+        Args:
+            entries: list of (keyword, value, comment, typestring) tuples
+        """
+
+        set_keyword = self.set_keyword
+        for keyword, value, comment, typestring in entries:
+            set_keyword(keyword, value, comment, typestring)
+
+        return
+
     def set_keyword_string(self, keystring):
         """
         Set keyword data from a single string.
@@ -225,6 +238,23 @@ class Header(object):
 
         return [value, comment, t]
 
+    def get_all_items(self) -> list:
+        """
+        Return all keywords with their values, comments, and types.
+        Comment is an empty string if not defined.
+        Returns:
+            list of [keyword, value, comment, type] sorted by keyword
+        """
+
+        values = self.values
+        comments = self.comments
+        typestrings = self.typestrings
+
+        return [
+            [keyword, values[keyword], comments[keyword] or "", typestrings[keyword]]
+            for keyword in self.get_keywords()
+        ]
+
     def delete_keyword(self, keyword: str):
         """
         Delete a keyword.
@@ -250,9 +280,10 @@ class Header(object):
         Delete all keywords.
         """
 
-        keys = self.get_keywords()
-        for key in keys:
-            self.delete_keyword(key)  # delete in header
+        # typestrings are kept, as in delete_keyword()
+        self.keywords.clear()
+        self.values.clear()
+        self.comments.clear()
 
         return
 
@@ -401,6 +432,11 @@ class ObjectHeaderMethods(object):
 
         # Example: Header[2][1] is the value of keyword 2 and Header[2][3] is its type.
 
+        # read directly from the header when get_keyword is not overridden
+        if type(self).get_keyword is ObjectHeaderMethods.get_keyword:
+            header = self.header.get_all_items()
+            return header if header else None
+
         # get the header
         header = []
         reply = self.header.get_keywords()
@@ -47,6 +47,10 @@ class SocketInterface(object):
         self.reopen = 0
         #: connection timeout in seconds
         self.timeout = 0
+        #: socket send and receive buffer size in bytes
+        self.buffer_size = 1 << 20
+        #: reusable buffer for recv_line(), grown as needed
+        self.recv_buffer = bytearray(4096)
 
         #: socket instance
         self.socket: object = None
@@ -68,6 +72,14 @@ class SocketInterface(object):
 
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 0)
+
+        # small command/reply traffic should not wait on Nagle's algorithm
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # detect dead peers on long lived connections
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.buffer_size)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.buffer_size)
+
         try:
             self.socket.settimeout(0.1)
             self.socket.connect((self.host, int(self.port)))
@@ -123,7 +135,7 @@ class SocketInterface(object):
                 )
 
             self.send(command, terminator)
-            reply = self.recv(-1, "\n")
+            reply = self.recv_line()
 
         self.last_response = reply
 
@@ -134,22 +146,26 @@ class SocketInterface(object):
 
         return reply
 
-    def send(self, command: str, terminator: str = "\n") -> None:
+    def send(self, command: str | bytes, terminator: str = "\n") -> None:
         """
-        Send a command string to the server.
+        Send a command string or a binary buffer to the server.
         Args:
-            command: command string to send
+            command: command string or bytes to send
             terminator: termination string to append the command
         """
 
         self.last_command = command
+        if isinstance(command, bytes):
+            data = command + terminator.encode()
+        else:
+            data = str.encode(command + terminator)
         try:
-            self.socket.send(str.encode(command + terminator))
+            self.socket.sendall(data)
         except ConnectionResetError:
             if self.reopen:
                 self.close()
                 self.open()
-                self.socket.send(str.encode(command + terminator))
+                self.socket.sendall(data)
             else:
                 raise
 
@@ -196,6 +212,35 @@ class SocketInterface(object):
 
         return reply
 
+    def recv_line(self) -> str:
+        """
+        Receives a single reply line from a server into a reusable buffer.
+        Blocks until the reply ends with a newline.
+        Returns:
+            reply string without the CR/LF terminator.
+        """
+
+        buffer = self.recv_buffer
+        view = memoryview(buffer)
+        size = 0
+        while True:
+            if size == len(buffer):
+                view.release()
+                buffer.extend(bytes(len(buffer)))
+                view = memoryview(buffer)
+            try:
+                count = self.socket.recv_into(view[size:])
+            except ConnectionAbortedError:
+                raise azcam.exceptions.AzcamError("Connection aborted")
+            if count == 0:
+                raise azcam.exceptions.AzcamError("Connection closed by server")
+            size += count
+            if buffer[size - 1] == 10:  # found LF terminator at end
+                break
+        view.release()
+
+        return buffer[:size].decode().rstrip("\r\n")
+
     def set_timeout(self, timeout: float = -1.0) -> None:
         """
         Set the receive timeout for socket connection.
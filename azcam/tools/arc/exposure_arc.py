@@ -13,6 +13,26 @@ from azcam.tools.exposure import Exposure
 from .receive_data import ReceiveData
 
 
+class Sleeper(object):
+    """
+    Adaptive sleep intervals for polling toward the end of an integration.
+    Long waits use coarse steps which shrink as the end time approaches.
+    """
+
+    def __init__(self, min_step=0.05, max_step=2.0, margin=0.6):
+        self.min_step = min_step
+        self.max_step = max_step
+        self.margin = margin
+
+    def interval(self, remaining):
+        """
+        Return the time to sleep when remaining seconds are left.
+        Never sleeps past the margin before the end unless min_step is larger.
+        """
+
+        return max(self.min_step, min(self.max_step, remaining - self.margin))
+
+
 class ExposureArc(Exposure):
     """
     Defines the exposure class for ARC controllers which makes an exposure.
@@ -23,106 +43,137 @@ class ExposureArc(Exposure):
 
         self.receive_data = ReceiveData(self)
 
+        #: set by readout() when the image data is valid
+        self.image_ready = threading.Event()
+        #: thread sending the last image when write_async is set
+        self.send_thread = None
+
     def integrate(self):
         """
         Integration.
         """
 
+        controller = azcam.db.tools["controller"]
+        flags = self.exposureflags
+        EXPOSING = flags["EXPOSING"]
+        ABORT = flags["ABORT"]
+        PAUSE = flags["PAUSE"]
+        PAUSED = flags["PAUSED"]
+        RESUME = flags["RESUME"]
+        READ = flags["READ"]
+
         # start integration
-        self.exposure_flag = self.exposureflags["EXPOSING"]
+        self.exposure_flag = EXPOSING
         imagetype = self.image_type.lower()
 
         # start exposure
         if imagetype != "zero":
             azcam.log("Integration started")
-        azcam.db.tools["controller"].start_exposure()
+        controller.start_exposure()
         self.dark_time_start = time.time()
         reply = self.get_exposuretime_remaining()
         remtime = reply
         lasttime = remtime
 
         # countdown and check for async. ExposureFlag changes
-        loopcount = 0
+        # remaining time is stuck if it does not change for stuck_time seconds
+        stuck_time = 10.0
+        lastchange = time.monotonic()
+        sleeper = Sleeper(0.05, 2.0, 0.6)
 
         while remtime > 0.6:
-            if self.exposure_flag == self.exposureflags["EXPOSING"]:  # no EF changes
-                time.sleep(min(remtime, 0.5))
+            flag = self.exposure_flag
+            if flag == EXPOSING:  # no EF changes
+                # wakes early when the exposure flag changes
+                self.flag_event.wait(sleeper.interval(remtime))
+                self.flag_event.clear()
                 reply = self.get_exposuretime_remaining()
                 remtime = reply
                 azcam.log(f"Integration: {remtime:0.3f} seconds remaining", level=3)
-                if remtime == lasttime:
-                    loopcount += 1
-                else:
-                    loopcount = 0
+                now = time.monotonic()
+                if remtime != lasttime:
+                    lastchange = now
                     lasttime = remtime
 
-            if loopcount > 20:
-                azcam.log("ERROR Integration time stuck")
-                self.exposure_flag = self.exposureflags["ABORT"]
-                azcam.db.tools["controller"].exposure_abort()
-                break
-            elif (
-                self.exposure_flag == self.exposureflags["ABORT"]
-            ):  # AbortExposure received
+                if now - lastchange > stuck_time:
+                    azcam.log("ERROR Integration time stuck")
+                    self.exposure_flag = ABORT
+                    controller.exposure_abort()
+                    break
+            elif flag == PAUSED:  # already paused so wait for a flag change
+                self.flag_event.wait(0.5)
+                self.flag_event.clear()
+            elif flag == ABORT:  # AbortExposure received
                 if self.is_exposure_sequence:
                     azcam.log("Stopping exposure sequence")
                     self.is_exposure_sequence = 0
                     self.exposure_sequence_number = 1
-                    self.exposure_flag = self.exposureflags["EXPOSING"]
+                    self.exposure_flag = EXPOSING
                 else:
-                    azcam.db.tools["controller"].exposure_abort()
+                    controller.exposure_abort()
                     break
-            elif (
-                self.exposure_flag == self.exposureflags["PAUSE"]
-            ):  # PauseExposure received
-                azcam.db.tools["controller"].exposure_pause()
-                self.exposure_flag = self.exposureflags["PAUSED"]
+            elif flag == PAUSE:  # PauseExposure received
+                controller.exposure_pause()
+                self.exposure_flag = PAUSED
                 azcam.log("Integration paused")
-            elif (
-                self.exposure_flag == self.exposureflags["RESUME"]
-            ):  # ResumeExposure received
-                azcam.db.tools["controller"].exposure_resume()
-                self.exposure_flag = self.exposureflags["EXPOSING"]
+            elif flag == RESUME:  # ResumeExposure received
+                controller.exposure_resume()
+                self.exposure_flag = EXPOSING
                 reply = self.get_exposuretime_remaining()
                 remtime = reply
+                lasttime = remtime
+                lastchange = time.monotonic()  # time does not change while paused
                 azcam.log("Integration resumed")
-            elif (
-                self.exposure_flag == self.exposureflags["READ"]
-            ):  # ReadExposure received
+            elif flag == READ:  # ReadExposure received
                 remtime = 0.0
                 self.exposure_time_actual = (
                     self.exposure_time - self.exposure_time_remaining
                 )
                 break
-            elif (
-                self.exposure_flag == self.exposureflags["PAUSE"]
-            ):  # already paused so just loop
-                time.sleep(0.5)
 
-        if self.exposure_flag == self.exposureflags["ABORT"]:  # abort in remaining time
+        if self.exposure_flag != ABORT:
+            # wait out the remaining time, waking early only for an abort
+            tail_end = time.monotonic() + remtime + 0.1
+            while self.exposure_flag != ABORT:
+                wait = tail_end - time.monotonic()
+                if wait <= 0:
+                    break
+                self.flag_event.wait(wait)
+                self.flag_event.clear()
+
+            if self.exposure_flag == ABORT:  # AbortExposure received
+                if self.is_exposure_sequence:
+                    azcam.log("Stopping exposure sequence")
+                    self.is_exposure_sequence = 0
+                    self.exposure_sequence_number = 1
+                    self.exposure_flag = EXPOSING
+                else:
+                    controller.exposure_abort()
+
+        if self.exposure_flag == ABORT:  # abort in remaining time
             azcam.log("Integration aborted")
         else:
-            time.sleep(remtime + 0.1)
-            self.exposure_flag = self.exposureflags["READ"]  # set to readout
+            self.exposure_flag = READ  # set to readout
 
         self.dark_time = time.time() - self.dark_time_start
 
         # turn off comp lamps
         if not self.comp_sequence:
             if self.comp_exposure:
-                if not azcam.db.tools["instrument"].shutter_strobe:
-                    azcam.db.tools["instrument"].comps_off()
-                azcam.db.tools["instrument"].set_comps("shutter")
+                instrument = azcam.db.tools["instrument"]
+                if not instrument.shutter_strobe:
+                    instrument.comps_off()
+                instrument.set_comps("shutter")
 
         # extra close shutter command
-        reply = azcam.db.tools["controller"].set_shutter(0)
+        reply = controller.set_shutter(0)
 
         # set times
         self.exposure_time_remaining = 0
         if imagetype == "zero":
             self.exposure_time = self.exposure_time_saved
 
-        if self.exposure_flag == self.exposureflags["ABORT"]:
+        if self.exposure_flag == ABORT:
             azcam.exceptions.warning("Integration aborted")
         else:
             azcam.log("Integration finished", level=2)
@@ -134,19 +185,23 @@ class ExposureArc(Exposure):
         Exposure readout.
         """
 
-        self.exposure_flag = self.exposureflags["READ"]
+        controller = azcam.db.tools["controller"]
+        flags = self.exposureflags
+
+        self.exposure_flag = flags["READ"]
+        self.image_ready.clear()
 
         imagetype = self.image_type.lower()
 
         if imagetype == "ramp":
-            azcam.db.tools["controller"].set_shutter(1)
+            controller.set_shutter(1)
 
         if self.tdi_mode:
             self.set_tdi_delay(True)
 
         # start readout
-        azcam.db.tools["controller"].start_readout()
-        self.exposure_flag = self.exposureflags["READOUT"]
+        controller.start_readout()
+        self.exposure_flag = flags["READOUT"]
         azcam.log("Readout started")
 
         # start data transfer, returns when all data is received
@@ -163,34 +218,35 @@ class ExposureArc(Exposure):
             azcam.log("User abort in exposure sequence")
 
         self.image.valid = 1
+        self.image_ready.set()
 
         if imagetype == "ramp":
-            azcam.db.tools["controller"].set_shutter(0)
+            controller.set_shutter(0)
 
         if self.tdi_mode:
             self.set_tdi_delay(False)
 
-        if self.exposure_flag == self.exposureflags["ABORT"]:
+        if self.exposure_flag == flags["ABORT"]:
             # if aborted in a sequence, reset flags and let finish without error
             if self.is_exposure_sequence:
                 azcam.log("Stopping exposure sequence in Exposure")
                 self.is_exposure_sequence = 0
                 self.exposure_sequence_number = 1
-                self.exposure_flag = self.exposureflags["READ"]
+                self.exposure_flag = flags["READ"]
             else:
                 azcam.log("Readout aborted")
                 raise azcam.exceptions.AzcamError("Readout aborted", error_code=3)
-        elif self.exposure_flag == self.exposureflags["ERROR"]:
+        elif self.exposure_flag == flags["ERROR"]:
             if self.is_exposure_sequence:
-                self.exposure_flag = self.exposureflags["NONE"]
+                self.exposure_flag = flags["NONE"]
                 raise azcam.exceptions.AzcamError("Exposure sequence error occurred")
             else:
-                self.exposure_flag = self.exposureflags["ABORT"]
+                self.exposure_flag = flags["ABORT"]
                 azcam.log("Readout aborted")
                 raise azcam.exceptions.AzcamError("Readout aborted", error_code=3)
         else:
             azcam.log("Readout finished", level=2)
-            self.exposure_flag = self.exposureflags["NONE"]
+            self.exposure_flag = flags["NONE"]
 
         return
 
@@ -199,7 +255,15 @@ class ExposureArc(Exposure):
         Completes an exposure by writing file and displaying image.
         """
 
-        self.exposure_flag = self.exposureflags["WRITING"]
+        flags = self.exposureflags
+
+        self.exposure_flag = flags["WRITING"]
+
+        # the previous asynchronous send may still be reading the temp file
+        if self.send_thread is not None and self.send_thread.is_alive():
+            azcam.log("Waiting for previous image send to finish")
+            self.send_thread.join()
+        self.send_thread = None
 
         # if remote write, LocalFile is local temp file
         if self.send_image:
@@ -213,12 +277,8 @@ class ExposureArc(Exposure):
         self.last_filename = LocalFile
 
         # wait for image data to be received
-        loop = 0
-        while not self.image.valid and loop < 100:
-            loop += 1
-            time.sleep(0.050)
-            if loop >= 100:
-                azcam.log("ERROR image data not received in time")
+        if not self.image.valid and not self.image_ready.wait(5.0):
+            azcam.log("ERROR image data not received in time")
 
         # update controller header with keywords which might have changed
         et = float(int(self.exposure_time_actual * 1000.0) / 1000.0)
@@ -250,20 +310,20 @@ class ExposureArc(Exposure):
             # send image to remote image server
             elif self.send_image:
                 if self.write_async:
-                    self.exposure_flag = self.exposureflags[
-                        "NONE"
-                    ]  # reset flag now so next exposure can start
+                    # reset flag now so next exposure can start
+                    self.exposure_flag = flags["NONE"]
                     azcam.log("Sending image asynchronously")
-                    sendthread = threading.Thread(
+                    self.send_thread = threading.Thread(
                         target=self.sendimage.send_image,
                         name="writeasync",
-                        args=(self.get_filename()),
+                        args=(LocalFile, self.get_filename()),
+                        daemon=True,
                     )
-                    sendthread.start()
+                    self.send_thread.start()
 
                     # increment file sequence number now and return
                     self.increment_filenumber()
-                    self.exposure_flag = self.exposureflags["NONE"]
+                    self.exposure_flag = flags["NONE"]
                     return
 
                 else:
@@ -290,7 +350,7 @@ class ExposureArc(Exposure):
         if self.save_file:
             self.increment_filenumber()
 
-        self.exposure_flag = self.exposureflags["NONE"]
+        self.exposure_flag = flags["NONE"]
 
         return
 
@@ -316,8 +376,11 @@ class ExposureArc(Exposure):
                 "Abort readout not supported for this controller"
             )
 
+        self.abort_event.set()
+
         if self.exposure_flag != self.exposureflags["NONE"]:
             self.exposure_flag = self.exposureflags["ABORT"]
+            self.flag_event.set()
 
         return
 
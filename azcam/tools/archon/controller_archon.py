@@ -13,6 +13,9 @@ import azcam.exceptions
 import azcam.sockets
 from azcam.tools.controller import Controller
 
+# Archon parameter word length limit for IntMS and NoIntMS (1048574)
+_ARCHON_TMAX = (1 << 20) - 2
+
 
 class ControllerArchon(Controller):
     """
@@ -27,6 +30,16 @@ class ControllerArchon(Controller):
     EXP_FETCH = 4
     EXP_DONE = 5
 
+    # number of commands pipelined per write when downloading configuration data
+    CONFIG_BATCH_SIZE = 64
+
+    # FRAME keyword suffixes converted to integers in frame_ints (hex and decimal)
+    FRAME_HEX_KEYS = ("TIMER", "TIMESTAMP")
+    FRAME_INT_KEYS = ("FRAME", "PIXELS", "LINES", "COMPLETE", "WIDTH", "HEIGHT")
+
+    # pre-encoded command prefixes indexed by command id
+    CMD_PREFIXES = [f">{i:02X}".encode() for i in range(256)]
+
     power_values = [
         "UNKNOWN",
         "NOT_CONFIGURED",
@@ -71,6 +84,8 @@ class ControllerArchon(Controller):
         self.exp_time_ms = 0
         self.int_ms = 0
         self.noint_ms = 0
+        # (int_ms + noint_ms) in seconds, updated whenever either changes
+        self.int_noint_sec = 0.0
         self.pixels = 0
         self.lines = 0
 
@@ -78,14 +93,16 @@ class ControllerArchon(Controller):
         self.frame = 0
         # FRAME data dictionary
         self.dict_frame = {}
+        # FRAME integer values (timers, counters and sizes)
+        self.frame_ints = {}
 
         # response to the STATUS command
         self.status = 0
         # STATUS data dictionary
         self.dict_status = {}
 
-        # ronfig data lines read from a file or downloaded - raw format 'parameter=value'
-        self.config_data = []
+        # config data lines read from a file or downloaded - raw format 'parameter=value'
+        self.config_data: list[str] = []
 
         # Sorted Parameters section of the configuration data
         self.config_params = []
@@ -105,19 +122,30 @@ class ControllerArchon(Controller):
         # Taplines dictionary
         self.dict_taplines = {}
 
+        # prebuilt commands by parameter name:
+        # (config key, 'WCONFIGxxxxPARAMETERn=') pairs and 'RCONFIGxxxx' strings
+        self.dict_param_cmds = {}
+        self.dict_rconfig_cmd = {}
+
+        # number of PARAMETER entries in the config data
+        self.num_params = 0
+
         # Config data OK flag
         self.config_ok = 0
 
         self.read_buffer = 0
 
+        # readout geometry used by get_pixels_remaining, reset for each exposure
+        self.readout_geometry = None
+
+        # FRAME polling interval range in seconds while waiting for a new frame
+        self.poll_delay_min = 0.01
+        self.poll_delay_max = 0.2
+
         self.currframe1 = 0
         self.currframe2 = 0
         self.currframe3 = 0
 
-        # Config data read from a file of from the GUI - raw format 'parameter=value'
-        self.config_data = ""
-        # Config data dictionary
-
         self.power_status = "UNKNOWN"
         self.archon_status = 0
 
@@ -142,12 +170,6 @@ class ControllerArchon(Controller):
         self.clock_boards = [""]
         self.video_boards = [""]
 
-        self.pixels = 0
-        self.lines = 0
-
-        # video gain flag
-        self.video_gain = 1
-
         # CDS parameters (taplines) - ex: ["AD1L, -3.0, 3000", "AD2R, 3.0, 3000"]
         self.cds = []
 
@@ -206,38 +228,89 @@ class ControllerArchon(Controller):
         """
 
         with self.lock:
-            if not self.camserver.open():
+            # the connection is kept open, so only call open() when it is not
+            if self.camserver.socket is None and not self.camserver.open():
                 raise azcam.exceptions.AzcamError(
                     "Could not open connection to controller"
                 )
 
             self.camserver.lastcmd_id = self.camserver.cmd_id
             self.camserver.cmd_id = (self.camserver.cmd_id + 1) & 0xFF
-            preCmd = ">%02X" % (self.camserver.cmd_id)
-            preResp = "<%02X" % (self.camserver.cmd_id)
-            cmd = preCmd + Command
+            preResp = f"<{self.camserver.cmd_id:02X}"
             if self.verbosity > 2:
-                print("===>", cmd)
+                print("===>", f">{self.camserver.cmd_id:02X}{Command}")
 
-            self.camserver.send(cmd, "\r\n")
+            self.camserver.send(
+                self.CMD_PREFIXES[self.camserver.cmd_id] + Command.encode(), "\r\n"
+            )
 
             if Command not in ["WARMBOOT", "REBOOT"]:
-                reply = self.camserver.recv(-1)
+                reply = self.camserver.recv_line()
                 if self.verbosity > 2:
                     print("<===", reply[:40])
-                status = reply.split(" ")[0]
 
                 # check if the reply is synchronized
-                if status[0:3] == preResp:
+                if reply.startswith(preResp):
                     return reply[3:]
                 else:
-                    if reply[0] == "?":
+                    if reply.startswith("?"):
                         raise azcam.exceptions.AzcamError("Archon response not valid")
                     else:
                         raise azcam.exceptions.AzcamError("Archon response out of sync")
 
         return None  # no Archon reponse is OK
 
+    def archon_command_batch(self, commands):
+        """
+        Send a list of commands to the Archon controller in a single write.
+        Replies are read back in order and checked for synchronization.
+        Returns the list of replies with the response prefix removed.
+        """
+
+        if not commands:
+            return []
+
+        with self.lock:
+            # the connection is kept open, so only call open() when it is not
+            if self.camserver.socket is None and not self.camserver.open():
+                raise azcam.exceptions.AzcamError(
+                    "Could not open connection to controller"
+                )
+
+            frames = []
+            preResps = []
+            for command in commands:
+                self.camserver.lastcmd_id = self.camserver.cmd_id
+                self.camserver.cmd_id = (self.camserver.cmd_id + 1) & 0xFF
+                frames.append(f">{self.camserver.cmd_id:02X}{command}")
+                preResps.append(f"<{self.camserver.cmd_id:02X}")
+            if self.verbosity > 2:
+                print("===>", frames[0], f"[{len(frames)} commands]")
+
+            self.camserver.send("\r\n".join(frames).encode(), "\r\n")
+
+            # read until one reply line has been received for each command
+            lines = []
+            partial = b""
+            while len(lines) < len(frames):
+                data = self.camserver.socket.recv(65536)
+                if not data:
+                    raise azcam.exceptions.AzcamError("Connection closed by controller")
+                *complete, partial = (partial + data).split(b"\n")
+                lines.extend(complete)
+
+        replies = []
+        for line, preResp in zip(lines, preResps):
+            reply = line.decode().rstrip("\r")
+            if reply.startswith(preResp):
+                replies.append(reply[3:])
+            elif reply.startswith("?"):
+                raise azcam.exceptions.AzcamError("Archon response not valid")
+            else:
+                raise azcam.exceptions.AzcamError("Archon response out of sync")
+
+        return replies
+
     def archon_bin_command(self, command):
         """
         Send binary command to the Archon controller.
@@ -247,7 +320,7 @@ class ControllerArchon(Controller):
             self.camserver.lastcmd_id = self.camserver.cmd_id
             self.camserver.cmd_id = (self.camserver.cmd_id + 1) & 0xFF
 
-            preCmd = ">%02X" % (self.camserver.cmd_id)
+            preCmd = f">{self.camserver.cmd_id:02X}"
             cmd = preCmd + command
 
             self.camserver.send(cmd, "\r\n")
@@ -341,9 +414,6 @@ class ControllerArchon(Controller):
         if self.status_valid != 1:
             raise azcam.exceptions.AzcamError("Controller reboot error")
 
-        # reconnect to controller
-        self.connect()
-
         # load configuration file
         self.update_config_data(1)
 
@@ -457,12 +527,17 @@ class ControllerArchon(Controller):
         # Update frame status values
 
         self.dict_frame = {}
+        self.frame_ints = {}
 
-        # Create a dictionary
+        # Create a dictionary, converting the values polled during exposures once here
         for item in self.frame:
             if len(item) > 0:
-                line = item.split("=")
-                self.dict_frame[line[0]] = line[1]
+                key, _, value = item.partition("=")
+                self.dict_frame[key] = value
+                if key.endswith(self.FRAME_HEX_KEYS):
+                    self.frame_ints[key] = int(value, 16)
+                elif key.endswith(self.FRAME_INT_KEYS):
+                    self.frame_ints[key] = int(value)
 
         return self.dict_frame
 
@@ -473,36 +548,8 @@ class ControllerArchon(Controller):
 
         if not self.config_ok:
             raise azcam.exceptions.AzcamError("Config data not loaded")
-        valPixels = 0
-        valLines = 0
 
-        indxParam = self.dict_wconfig[self.dict_params["Pixels"]]
-        cmd = "RCONFIG%04X" % (indxParam & 0xFFFF)
-        reply = self.archon_command(cmd)
-
-        if len(reply) > 0:
-            paramStr = reply.split("=")
-            if len(paramStr) == 3:
-                valPixels = int(paramStr[2])
-            else:
-                raise azcam.exceptions.AzcamError("Parameter error")
-        else:
-            raise azcam.exceptions.AzcamError("Parameter not found")
-
-        indxParam = self.dict_wconfig[self.dict_params["Lines"]]
-        cmd = "RCONFIG%04X" % (indxParam & 0xFFFF)
-        reply = self.archon_command(cmd)
-
-        if len(reply) > 0:
-            paramStr = reply.split("=")
-            if len(paramStr) == 3:
-                valLines = int(paramStr[2])
-            else:
-                raise azcam.exceptions.AzcamError("Parameter error")
-        else:
-            raise azcam.exceptions.AzcamError("Parameter not found")
-
-        return [valPixels, valLines]
+        return [self._rconfig_int("Pixels"), self._rconfig_int("Lines")]
 
     def set_size(self, Pixels, Lines):
         """
@@ -511,49 +558,32 @@ class ControllerArchon(Controller):
 
         if len(self.dict_config) <= 0:
             raise azcam.exceptions.AzcamError("Config data not loaded")
+
+        cmds = []
         if self.lines != Lines:
             self.lines = Lines
 
-            # update config dictionary
-            self.dict_config[self.dict_params["Lines"]] = "Lines=%s" % (Lines)
+            # update config dictionary and Archons Lines value
+            cmds.append(self._param_command("Lines", Lines))
             self.dict_config["LINECOUNT"] = Lines
 
-            # update Archons Lines value
-            indxParam = self.dict_wconfig[self.dict_params["Lines"]]
-            cmd = "WCONFIG%04X%s=%s" % (
-                indxParam & 0xFFFF,
-                self.dict_params["Lines"],
-                "Lines=" + str(Lines),
-            )
-            self.archon_command(cmd)
-
             indxParam = self.dict_wconfig["LINECOUNT"]
-            cmd = "WCONFIG%04X%s=%s" % (indxParam & 0xFFFF, "LINECOUNT", str(Lines))
-            self.archon_command(cmd)
+            cmd = f"WCONFIG{indxParam & 0xFFFF:04X}LINECOUNT={Lines}"
+            cmds.append(cmd)
 
         if self.pixels != Pixels:
             self.pixels = Pixels
 
-            # update config dictionary
-            self.dict_config[self.dict_params["Pixels"]] = "Pixels=%s" % (Pixels)
+            # update config dictionary and Archons Pixels value
+            cmds.append(self._param_command("Pixels", Pixels))
             self.dict_config["PIXELCOUNT"] = Pixels
 
-            # update Archons Pixels value
-            indxParam = self.dict_wconfig[self.dict_params["Pixels"]]
-            cmd = "WCONFIG%04X%s=%s" % (
-                indxParam & 0xFFFF,
-                self.dict_params["Pixels"],
-                "Pixels=" + str(Pixels),
-            )
-            self.archon_command(cmd)
-
             indxParam = self.dict_wconfig["PIXELCOUNT"]
-            cmd = "WCONFIG%04X%s=%s" % (
-                indxParam & 0xFFFF,
-                "PIXELCOUNT",
-                str(Pixels),
-            )
-            self.archon_command(cmd)
+            cmd = f"WCONFIG{indxParam & 0xFFFF:04X}PIXELCOUNT={Pixels}"
+            cmds.append(cmd)
+
+        if cmds:
+            self.archon_command_batch(cmds)
 
         return
 
@@ -599,21 +629,23 @@ class ControllerArchon(Controller):
         cmd = "CLEARCONFIG"
         self.archon_command(cmd)
 
-        # WCONFIG values
+        # WCONFIG values - bind lookups locally as this loop runs for every config line
+        archon_command = self.archon_command
+        dict_config = self.dict_config
+        dict_wconfig = self.dict_wconfig
         for line in self.config_data:
-            item = line.split("=")
-            if len(item) >= 2:
-                cmd = "WCONFIG%04X%s=%s" % (
-                    cnt & 0xFFF,
-                    item[0],
-                    self.dict_config[item[0]].replace('"', ""),
-                )
-                self.dict_wconfig[item[0]] = cnt
-                self.archon_command(cmd)
+            name, sep, _ = line.partition("=")
+            if sep:
+                value = dict_config[name].replace('"', "")
+                cmd = f"WCONFIG{cnt & 0xFFF:04X}{name}={value}"
+                dict_wconfig[name] = cnt
+                archon_command(cmd)
                 cnt += 1
 
         self.poll(1)
 
+        self._update_config_commands()
+
         return
 
     def read_config_file(self, filename):
@@ -626,26 +658,23 @@ class ControllerArchon(Controller):
 
         # Get configuration data from the timing file
         with open(self.timing_file, "r") as f:
-            fBuff = f.read()
-            sBuff = fBuff.split("\n")
-            fLen = len(sBuff)
-
-            # Extract CONFIG data
-            indx = 0
-            copy = 0
-            pos = 0
+            sBuff = f.read().split("\n")
 
-            for line in sBuff:
-                if line == "[CONFIG]":
-                    copy = 1
+        # Extract CONFIG data - all non-empty lines after the [CONFIG] header
+        try:
+            start = sBuff.index("[CONFIG]") + 1
+        except ValueError:
+            start = len(sBuff)
 
-                indx += 1
-                if copy == 1 and indx < fLen and len(sBuff[indx]) > 0:
-                    self.config_data.append(sBuff[indx].replace("\\", "/"))
-                    self.dict_wconfig[self.config_data[pos].split("=")[0]] = pos
-                    pos += 1
+        pos = 0
+        for line in sBuff[start:]:
+            if line:
+                line = line.replace("\\", "/")
+                self.config_data.append(line)
+                self.dict_wconfig[line.partition("=")[0]] = pos
+                pos += 1
 
-            self.config_lines_cnt = pos
+        self.config_lines_cnt = pos
 
         azcam.log(f"Read {self.config_lines_cnt} configuration lines", level=3)
 
@@ -675,19 +704,9 @@ class ControllerArchon(Controller):
         # get configuration data from the Archon controller
         else:
             azcam.log("Downloading configuration data from controller.", level=2)
-            cnt = 0x0000
-            endCfg = 0
-
-            while endCfg != 1:
-                cmd = "RCONFIG%04X" % (cnt & 0xFFFF)
-                reply = self.archon_command(cmd)
-                cnt += 1
-
-                if len(reply) > 0:
-                    self.config_data.append(reply)
-                    self.dict_wconfig[reply.split("=")[0]] = cnt - 1
-                else:
-                    endCfg = 1
+            self.config_data = self.read_config_lines()
+            for cnt, line in enumerate(self.config_data):
+                self.dict_wconfig[line.split("=")[0]] = cnt
 
             self.config_lines_cnt = len(self.config_data)
 
@@ -701,8 +720,9 @@ class ControllerArchon(Controller):
 
         # update parameters dictionaries
         paramCnt = int(self.dict_config["PARAMETERS"])
+        self.num_params = paramCnt
         for param in range(0, paramCnt):
-            paramStr = "PARAMETER" + str(param)
+            paramStr = f"PARAMETER{param}"
             paramName = self.dict_config[paramStr].split("=")[0].replace('"', "")
             self.config_params.append(
                 self.config_data[int(self.dict_wconfig[paramStr])]
@@ -722,7 +742,7 @@ class ControllerArchon(Controller):
         cnt = 0
         tapLinesCnt = int(self.dict_config["TAPLINES"])
         for param in range(0, tapLinesCnt):
-            tapLine = "TAPLINE" + str(param)
+            tapLine = f"TAPLINE{param}"
             tapLineVal = self.dict_config[tapLine].split("=")[0].replace('"', "")
             if len(tapLineVal) > 0:
                 cnt += 1
@@ -754,6 +774,9 @@ class ControllerArchon(Controller):
             self.dict_config[self.dict_params["NoIntMS"]].replace('"', "").split("=")
         )
         self.noint_ms = int(NoIntMS[1])
+        self.int_noint_sec = (self.int_ms + self.noint_ms) / 1000.0
+
+        self._update_config_commands()
 
         # Config data is valid
         self.config_ok = 1
@@ -779,6 +802,55 @@ class ControllerArchon(Controller):
 
         return
 
+    def _update_config_commands(self):
+        """
+        Build the WCONFIG prefix and RCONFIG command for each parameter from the
+        current config line positions.
+        """
+
+        self.dict_param_cmds = {}
+        self.dict_rconfig_cmd = {}
+        for paramName, paramStr in self.dict_params.items():
+            indxParam = self.dict_wconfig[paramStr] & 0xFFFF
+            prefix = f"WCONFIG{indxParam:04X}{paramStr}="
+            self.dict_param_cmds[paramName] = (paramStr, prefix)
+            self.dict_rconfig_cmd[paramName] = f"RCONFIG{indxParam:04X}"
+
+        return
+
+    def _rconfig_int(self, name, parameter=True):
+        """
+        Read an integer value from the controller with RCONFIG.
+        name is a parameter name or, if parameter is False, a config data keyword.
+        Parameter replies are 'PARAMETERn=name=value', keyword replies are 'name=value'.
+        """
+
+        if parameter:
+            cmd = self.dict_rconfig_cmd[name]
+        else:
+            cmd = f"RCONFIG{self.dict_wconfig[name] & 0xFFFF:04X}"
+
+        reply = self.archon_command(cmd)
+
+        if len(reply) == 0:
+            raise azcam.exceptions.AzcamError("Parameter not found")
+        if reply.count("=") != (2 if parameter else 1):
+            raise azcam.exceptions.AzcamError("Parameter error")
+
+        return int(reply.rpartition("=")[2])
+
+    def _param_command(self, name, value):
+        """
+        Update a parameter value in the config dictionary.
+        Returns the WCONFIG command which writes it to the controller.
+        """
+
+        paramStr, prefix = self.dict_param_cmds[name]
+        line = f"{name}={value}"
+        self.dict_config[paramStr] = line
+
+        return prefix + line
+
     def power_on(self, wait=1):
         """
         Turns power on
@@ -863,13 +935,13 @@ class ControllerArchon(Controller):
         Sets TAPLINES values.
         """
 
-        lenCDS = len(self.cds)
-
-        for tapLinesCnt in range(lenCDS):
-            tapLine = "TAPLINE" + str(tapLinesCnt)
+        cmds = []
+        for tapLinesCnt, cds in enumerate(self.cds):
+            tapLine = f"TAPLINE{tapLinesCnt}"
             indx = self.dict_wconfig[tapLine]
-            cmd = "WCONFIG%04X%s=%s" % (indx & 0xFFFF, tapLine, self.cds[tapLinesCnt])
-            self.archon_command(cmd)
+            cmds.append(f"WCONFIG{indx & 0xFFFF:04X}{tapLine}={cds}")
+        if cmds:
+            self.archon_command_batch(cmds)
 
         self.apply_cds()
 
@@ -883,11 +955,11 @@ class ControllerArchon(Controller):
         self.rcds = []
 
         for tapLines in range(self.tap_lines):
-            indxParam = self.dict_wconfig["TAPLINE" + str(tapLines)]
-            cmd = "RCONFIG%04X" % (indxParam & 0xFFFF)
+            indxParam = self.dict_wconfig[f"TAPLINE{tapLines}"]
+            cmd = f"RCONFIG{indxParam & 0xFFFF:04X}"
 
             reply = self.archon_command(cmd)
-            respLine = reply.split("=")
+            respLine = reply.split("=", 1)
             self.rcds.append(respLine[1])
 
         return self.rcds
@@ -910,20 +982,7 @@ class ControllerArchon(Controller):
         if not self.config_ok:
             raise azcam.exceptions.AzcamError("Configuration data not loaded")
 
-        indxParam = self.dict_wconfig[self.dict_params["ContinuousExposures"]]
-        cmd = "RCONFIG%04X" % (indxParam & 0xFFFF)
-        reply = self.archon_command(cmd)
-
-        if len(reply) > 0:
-            paramStr = reply.split("=")
-            if len(paramStr) == 3:
-                return int(paramStr[2])
-            else:
-                raise azcam.exceptions.AzcamError("Parameter error")
-        else:
-            raise azcam.exceptions.AzcamError("Parameter not found")
-
-        return
+        return self._rconfig_int("ContinuousExposures")
 
     def set_continuous_exposures(self, cont_exp):
         """
@@ -935,18 +994,8 @@ class ControllerArchon(Controller):
 
         self.cont_exposures = int(cont_exp)
 
-        # update config dictionary
-        self.dict_config[self.dict_params["ContinuousExposures"]] = (
-            "ContinuousExposures=%s" % (self.cont_exposures)
-        )
-
-        # update Archons CountinuousExposures value
-        indxParam = self.dict_wconfig[self.dict_params["ContinuousExposures"]]
-        cmd = "WCONFIG%04X%s=%s" % (
-            indxParam & 0xFFFF,
-            self.dict_params["ContinuousExposures"],
-            "ContinuousExposures=" + str(self.cont_exposures),
-        )
+        # update config dictionary and Archons CountinuousExposures value
+        cmd = self._param_command("ContinuousExposures", self.cont_exposures)
         self.archon_command(cmd)
 
         return
@@ -956,17 +1005,11 @@ class ControllerArchon(Controller):
         Get Frame number.
         """
 
-        f1 = self.dict_frame["BUF1FRAME"]
-        f2 = self.dict_frame["BUF2FRAME"]
-        f3 = self.dict_frame["BUF3FRAME"]
+        frame_ints = self.frame_ints
 
-        if f2 > f1 and f2 > f3:
-            max = f2
-        elif f2 > f1 or f1 <= f3:
-            max = f3
-        else:
-            max = f1
-        return max
+        return max(
+            frame_ints["BUF1FRAME"], frame_ints["BUF2FRAME"], frame_ints["BUF3FRAME"]
+        )
 
     def get_parameters(self):
         """
@@ -975,10 +1018,8 @@ class ControllerArchon(Controller):
 
         self.parameters = {}
         if len(self.dict_config) > 0:
-            cnt = int(self.dict_config["PARAMETERS"])
-
-            for indx in range(cnt):
-                param = "PARAMETER" + str(indx)
+            for indx in range(self.num_params):
+                param = f"PARAMETER{indx}"
                 parname = self.dict_config[param].split("=")[0]
                 parvalue = self.dict_config[param].split("=")[1]
                 self.parameters[parname] = parvalue
@@ -1004,13 +1045,11 @@ class ControllerArchon(Controller):
 
         found = 0
         if len(self.dict_config) > 0:
-            cnt = int(self.dict_config["PARAMETERS"])
-
-            for indx in range(cnt):
-                param = "PARAMETER" + str(indx)
+            for indx in range(self.num_params):
+                param = f"PARAMETER{indx}"
                 paramName = self.dict_config[param].split("=")[0]  # new
                 if paramName == Param:
-                    self.dict_config[param] = Param + "=" + str(value)
+                    self.dict_config[param] = f"{Param}={value}"
                     found = 1
                     break
 
@@ -1026,23 +1065,10 @@ class ControllerArchon(Controller):
         Get number of exposures.
         """
 
-        if self.config_ok:
-            indxParam = self.dict_wconfig[self.dict_params["Exposures"]]
-            cmd = "RCONFIG%04X" % (indxParam & 0xFFFF)
-            reply = self.archon_command(cmd)
-
-            if len(reply) > 0:
-                paramStr = reply.split("=")
-                if len(paramStr) == 3:
-                    return int(paramStr[2])
-                else:
-                    raise azcam.exceptions.AzcamError("Parameter error")
-            else:
-                raise azcam.exceptions.AzcamError("Parameter not found")
-        else:
+        if not self.config_ok:
             raise azcam.exceptions.AzcamError("Configuration data not loaded")
 
-        return self.exposures
+        return self._rconfig_int("Exposures")
 
     def set_exposures(self, Exp):
         """
@@ -1055,18 +1081,8 @@ class ControllerArchon(Controller):
 
             self.exposures = Exp
 
-            # update config dictionary
-            self.dict_config[self.dict_params["Exposures"]] = "Exposures=%s" % (
-                self.exposures
-            )
-
-            # update Archons Exposures value
-            indxParam = self.dict_wconfig[self.dict_params["Exposures"]]
-            cmd = "WCONFIG%04X%s=%s" % (
-                indxParam & 0xFFFF,
-                self.dict_params["Exposures"],
-                "Exposures=" + str(Exp),
-            )
+            # update config dictionary and Archons Exposures value
+            cmd = self._param_command("Exposures", self.exposures)
             self.archon_command(cmd)
 
         return
@@ -1104,20 +1120,7 @@ class ControllerArchon(Controller):
         if not self.config_ok:
             raise azcam.exceptions.AzcamError("Configuration data not loaded")
 
-        indxParam = self.dict_wconfig[self.dict_params["IntMS"]]
-        cmd = "RCONFIG%04X" % (indxParam & 0xFFFF)
-        reply = self.archon_command(cmd)
-
-        if len(reply) > 0:
-            paramStr = reply.split("=")
-            if len(paramStr) == 3:
-                return int(paramStr[2]) / 1000.0
-            else:
-                raise azcam.exceptions.AzcamError("IntMS parameter error")
-        else:
-            raise azcam.exceptions.AzcamError("IntMS parameter not found")
-
-        return
+        return self._rconfig_int("IntMS") / 1000.0
 
     def set_exposuretime(self, ExpTimeMS):
         """
@@ -1130,17 +1133,10 @@ class ControllerArchon(Controller):
 
         self.exp_time_ms = int(ExpTimeMS)
         self.int_ms = int(ExpTimeMS)
+        self.int_noint_sec = (self.int_ms + self.noint_ms) / 1000.0
 
-        # update config dictionary
-        self.dict_config[self.dict_params["IntMS"]] = "IntMS=%s" % (self.int_ms)
-
-        # update Archons IntMS value
-        indxParam = self.dict_wconfig[self.dict_params["IntMS"]]
-        cmd = "WCONFIG%04X%s=%s" % (
-            indxParam & 0xFFFF,
-            self.dict_params["IntMS"],
-            "IntMS=" + str(ExpTimeMS),
-        )
+        # update config dictionary and Archons IntMS value
+        cmd = self._param_command("IntMS", self.int_ms)
         self.archon_command(cmd)
 
         return
@@ -1153,20 +1149,7 @@ class ControllerArchon(Controller):
         if not self.config_ok:
             raise azcam.exceptions.AzcamError("Configuration data not loaded")
 
-        indxParam = self.dict_wconfig[self.dict_params["IntMS"]]
-        cmd = "RCONFIG%04X" % (indxParam & 0xFFFF)
-        reply = self.archon_command(cmd)
-
-        if len(reply) > 0:
-            paramStr = reply.split("=")
-            if len(paramStr) == 3:
-                return int(paramStr[2])
-            else:
-                raise azcam.exceptions.AzcamError("Parameter error")
-        else:
-            raise azcam.exceptions.AzcamError("Parameter not found")
-
-        return
+        return self._rconfig_int("IntMS")
 
     def set_int_ms(self, IntMS):
         """
@@ -1178,39 +1161,19 @@ class ControllerArchon(Controller):
 
         self.exp_time_ms = int(IntMS)
         self.int_ms = int(IntMS)
+        self.int_noint_sec = (self.int_ms + self.noint_ms) / 1000.0
 
         # special for long exposure times - IN PROGRESS
-        ms = IntMS
-        mul = 1
-        IntMul = mul
-        tmax = (1 << 20) - 2  # Archon parameter word length tmax=1048574
-        if ms > tmax:
-            mul = (ms - 1) / tmax + 1  # makes mul > 0
-            ms = ms / mul
-            IntMS = int(ms)
-            IntMul = int(mul)
-
-        # update config dictionary
-        self.dict_config[self.dict_params["IntMS"]] = "IntMS=%s" % (IntMS)
-        self.dict_config[self.dict_params["IntMul"]] = "IntMul=%s" % (IntMul)
-
-        # update Archons IntMS value
-        indxParam = self.dict_wconfig[self.dict_params["IntMS"]]
-        cmd = "WCONFIG%04X%s=%s" % (
-            indxParam & 0xFFFF,
-            self.dict_params["IntMS"],
-            "IntMS=" + str(IntMS),
-        )
-        self.archon_command(cmd)
+        IntMS = int(IntMS)
+        IntMul = 1
+        if IntMS > _ARCHON_TMAX:
+            IntMul = (IntMS - 1) // _ARCHON_TMAX + 1  # makes mul > 0
+            IntMS = IntMS // IntMul
 
-        # update Archons IntMul value
-        indxParam = self.dict_wconfig[self.dict_params["IntMul"]]
-        cmd = "WCONFIG%04X%s=%s" % (
-            indxParam & 0xFFFF,
-            self.dict_params["IntMul"],
-            "IntMul=" + str(IntMul),
-        )
-        self.archon_command(cmd)
+        # update config dictionary and Archons IntMS and IntMul values
+        cmd1 = self._param_command("IntMS", IntMS)
+        cmd2 = self._param_command("IntMul", IntMul)
+        self.archon_command_batch([cmd1, cmd2])
 
         return
 
@@ -1222,18 +1185,8 @@ class ControllerArchon(Controller):
         if not self.config_ok:
             raise azcam.exceptions.AzcamError("Configuration data not loaded")
 
-        # update config dictionary
-        self.dict_config[self.dict_params["ParallelPumping"]] = "ParallelPumping=%s" % (
-            str(flag)
-        )
-
-        # update Archons value
-        indxParam = self.dict_wconfig[self.dict_params["ParallelPumping"]]
-        cmd = "WCONFIG%04X%s=%s" % (
-            indxParam & 0xFFFF,
-            self.dict_params["ParallelPumping"],
-            "ParallelPumping=" + str(flag),
-        )
+        # update config dictionary and Archons value
+        cmd = self._param_command("ParallelPumping", flag)
         self.archon_command(cmd)
 
         return
@@ -1246,20 +1199,7 @@ class ControllerArchon(Controller):
         if not self.config_ok:
             raise azcam.exceptions.AzcamError("Configuration data not loaded")
 
-        indxParam = self.dict_wconfig[self.dict_params["NoIntMS"]]
-        cmd = "RCONFIG%04X" % (indxParam & 0xFFFF)
-        reply = self.archon_command(cmd)
-
-        if len(reply) > 0:
-            paramStr = reply.split("=")
-            if len(paramStr) == 3:
-                return int(paramStr[2])
-            else:
-                raise azcam.exceptions.AzcamError("Parameter error")
-        else:
-            raise azcam.exceptions.AzcamError("Paramter not found")
-
-        return
+        return self._rconfig_int("NoIntMS")
 
     def set_no_int_ms(self, NoIntMS):
         """
@@ -1270,38 +1210,19 @@ class ControllerArchon(Controller):
             raise azcam.exceptions.AzcamError("Configuration data not loaded")
 
         self.noint_ms = int(NoIntMS)
+        self.int_noint_sec = (self.int_ms + self.noint_ms) / 1000.0
 
         # special for long exposure times - IN PROGRESS
-        ms = NoIntMS
-        mul = 1
-        NoIntMul = mul
-        tmax = (1 << 20) - 2  # Archon parameter word length tmax=1048574
-        if ms > tmax:
-            mul = (ms - 1) / tmax + 1  # makes mul > 0
-            ms = ms / mul
-            NoIntMS = int(ms)
-            NoIntMul = int(mul)
-
-        # update config dictionary
-        self.dict_config[self.dict_params["NoIntMS"]] = "NoIntMS=%s" % (NoIntMS)
-        self.dict_config[self.dict_params["NoIntMul"]] = "NoIntMul=%s" % (NoIntMul)
-
-        # update Archons NoIntMS value
-        indxParam = self.dict_wconfig[self.dict_params["NoIntMS"]]
-        cmd = "WCONFIG%04X%s=%s" % (
-            indxParam & 0xFFFF,
-            self.dict_params["NoIntMS"],
-            "NoIntMS=" + str(NoIntMS),
-        )
-        self.archon_command(cmd)
+        NoIntMS = int(NoIntMS)
+        NoIntMul = 1
+        if NoIntMS > _ARCHON_TMAX:
+            NoIntMul = (NoIntMS - 1) // _ARCHON_TMAX + 1  # makes mul > 0
+            NoIntMS = NoIntMS // NoIntMul
 
-        indxParam = self.dict_wconfig[self.dict_params["NoIntMul"]]
-        cmd = "WCONFIG%04X%s=%s" % (
-            indxParam & 0xFFFF,
-            self.dict_params["NoIntMul"],
-            "NoIntMul=" + str(NoIntMul),
-        )
-        self.archon_command(cmd)
+        # update config dictionary and Archons NoIntMS and NoIntMul values
+        cmd1 = self._param_command("NoIntMS", NoIntMS)
+        cmd2 = self._param_command("NoIntMul", NoIntMul)
+        self.archon_command_batch([cmd1, cmd2])
 
         return
 
@@ -1322,44 +1243,16 @@ class ControllerArchon(Controller):
         if not self.config_ok:
             raise azcam.exceptions.AzcamError("Configuration data not loaded")
 
-        indxParam = self.dict_wconfig["RAWENABLE"]
-        cmd = "RCONFIG%04X" % (indxParam & 0xFFFF)
-        reply = self.archon_command(cmd)
+        self.rawdata_enable = self._rconfig_int("RAWENABLE", parameter=False)
 
-        if len(reply) > 0:
-            paramStr = reply.split("=")
-            if len(paramStr) == 2:
-                self.rawdata_enable = int(paramStr[1])
-                return int(paramStr[1])
-            else:
-                raise azcam.exceptions.AzcamError("Parameter error")
-        else:
-            raise azcam.exceptions.AzcamError("Parameter not found")
+        return self.rawdata_enable
 
     def set_raw_enable(self, RawEnable):
         """
         Set RAWENABLE value.
         """
 
-        if not self.config_ok:
-            raise azcam.exceptions.AzcamError("Configuration data not loaded")
-
-        self.rawdata_enable = RawEnable
-
-        # update config dictionary
-        self.dict_config["RAWENABLE"] = "%s" % (self.rawdata_enable)
-
-        # update Archons RAWENABLE value
-        indxParam = self.dict_wconfig["RAWENABLE"]
-        cmd = "WCONFIG%04X%s=%s" % (
-            indxParam & 0xFFFF,
-            "RAWENABLE",
-            str(self.rawdata_enable),
-        )
-        self.archon_command(cmd)
-        self.apply_cds()
-
-        return
+        return self.set_raw(enable=RawEnable)
 
     def get_raw_channel(self):
         """
@@ -1369,20 +1262,7 @@ class ControllerArchon(Controller):
         if not self.config_ok:
             raise azcam.exceptions.AzcamError("Configuration data not loaded")
 
-        indxParam = self.dict_wconfig["RAWSEL"]
-        cmd = "RCONFIG%04X" % (indxParam & 0xFFFF)
-        reply = self.archon_command(cmd)
-
-        if len(reply) > 0:
-            paramStr = reply.split("=")
-            if len(paramStr) == 2:
-                return int(paramStr[1]) + 1
-            else:
-                raise azcam.exceptions.AzcamError("Parameter error")
-        else:
-            raise azcam.exceptions.AzcamError("Parameter not found")
-
-        return
+        return self._rconfig_int("RAWSEL", parameter=False) + 1
 
     def set_raw_channel(self, RawChannel):
         """
@@ -1390,22 +1270,35 @@ class ControllerArchon(Controller):
         RAWSEL starts from 0.
         """
 
+        return self.set_raw(channel=RawChannel)
+
+    def set_raw(self, channel=None, enable=None):
+        """
+        Set RAWSEL (raw channel selection, starting from 1) and/or RAWENABLE values.
+        Values which are None are not changed. Both are written in a single batch
+        followed by one APPLYCDS.
+        """
+
         if not self.config_ok:
             raise azcam.exceptions.AzcamError("Configuration data not loaded")
 
-        self.rawdata_channel = RawChannel
-
-        # update config dictionary
-        self.dict_config["RAWSEL"] = "%s" % (self.rawdata_channel - 1)
+        values = {}
+        if channel is not None:
+            self.rawdata_channel = channel
+            values["RAWSEL"] = self.rawdata_channel - 1
+        if enable is not None:
+            self.rawdata_enable = enable
+            values["RAWENABLE"] = self.rawdata_enable
+        if not values:
+            return
 
-        # update Archons RAWENABLE value
-        indxParam = self.dict_wconfig["RAWSEL"]
-        cmd = "WCONFIG%04X%s=%s" % (
-            indxParam & 0xFFFF,
-            "RAWSEL",
-            str(self.rawdata_channel - 1),
-        )
-        self.archon_command(cmd)
+        # update config dictionary and Archons values
+        cmds = []
+        for keyword, value in values.items():
+            self.dict_config[keyword] = f"{value}"
+            indxParam = self.dict_wconfig[keyword]
+            cmds.append(f"WCONFIG{indxParam & 0xFFFF:04X}{keyword}={value}")
+        self.archon_command_batch(cmds)
         self.apply_cds()
 
         return
@@ -1418,20 +1311,31 @@ class ControllerArchon(Controller):
         if self.dict_frame == {} or self.read_buffer == 0:
             return 0
 
-        fp = azcam.db.tools["exposure"].get_focalplane()
-        # numseramps = fp[0] * fp[2]
-        # numparamps = fp[1] * fp[3]
-        numseramps = fp[2]
-        numparamps = fp[3]
-        naxis1 = int(self.dict_frame[f"BUF{self.read_buffer}WIDTH"])
-        naxis2 = int(self.dict_frame[f"BUF{self.read_buffer}HEIGHT"])
-        total_pixels = naxis1 * naxis2
+        # geometry is fixed for the exposure, so only compute it once per readout
+        if self.readout_geometry is None:
+            fp = azcam.db.tools["exposure"].get_focalplane()
+            # numseramps = fp[0] * fp[2]
+            # numparamps = fp[1] * fp[3]
+            numseramps = fp[2]
+            numparamps = fp[3]
+            naxis1 = self.frame_ints[f"BUF{self.read_buffer}WIDTH"]
+            naxis2 = self.frame_ints[f"BUF{self.read_buffer}HEIGHT"]
+            total_pixels = naxis1 * naxis2
+            splitmode = int(self.dict_config["FRAMEMODE"]) == 2
+            self.readout_geometry = (
+                numseramps,
+                numparamps,
+                naxis1,
+                total_pixels,
+                splitmode,
+            )
+        numseramps, numparamps, naxis1, total_pixels, splitmode = self.readout_geometry
 
-        pixels = int(self.dict_frame[f"BUF{self.read_buffer}PIXELS"])
-        lines = int(self.dict_frame[f"BUF{self.read_buffer}LINES"])
+        pixels = self.frame_ints[f"BUF{self.read_buffer}PIXELS"]
+        lines = self.frame_ints[f"BUF{self.read_buffer}LINES"]
 
         # this is for split pit mode
-        if int(self.dict_config["FRAMEMODE"]) == 2:
+        if splitmode:
             lines = lines * 2
         # pixels_read = lines * naxis1 + numparamps * pixels
         pixels_read = lines * naxis1 + (numparamps + numseramps) * pixels
@@ -1445,13 +1349,10 @@ class ControllerArchon(Controller):
         Last change: 13Jan2017 Zareba
         """
 
-        dt = int(self.dict_frame["TIMER"], 16) - self.exp_timer
-        et = self.int_ms / 1000.0 + self.noint_ms / 1000.0 - dt / 100000000.0
+        # timer counts in 10 ns units
+        et = self.int_noint_sec - (self.frame_ints["TIMER"] - self.exp_timer) * 1e-8
 
-        if et < 0:
-            et = 0
-
-        return et
+        return et if et > 0 else 0
 
     def start_exposure(self, wait=1):
         """
@@ -1460,14 +1361,15 @@ class ControllerArchon(Controller):
 
         # Set exposure state to UNKNOWN
         self.archon_status = self.EXP_UNKNOWN
+        self.readout_geometry = None
 
         # Check frame status
         self.get_frame()
 
         # Save current frame numbers
-        self.currframe1 = self.dict_frame["BUF1FRAME"]
-        self.currframe2 = self.dict_frame["BUF2FRAME"]
-        self.currframe3 = self.dict_frame["BUF3FRAME"]
+        self.currframe1 = self.frame_ints["BUF1FRAME"]
+        self.currframe2 = self.frame_ints["BUF2FRAME"]
+        self.currframe3 = self.frame_ints["BUF3FRAME"]
 
         # Start exposure -> send LOADPARAMS command for single exposure mode
         self.set_exposures(0)
@@ -1480,7 +1382,7 @@ class ControllerArchon(Controller):
 
         # Exposure start time (internal Archon controller timer - resolution 10 ns)
         self.get_frame()
-        self.exp_timer = int(self.dict_frame["TIMER"], 16)
+        self.exp_timer = self.frame_ints["TIMER"]
 
         int_time = (int(self.int_ms) + int(self.noint_ms)) / 1000
 
@@ -1501,26 +1403,19 @@ class ControllerArchon(Controller):
         # wait for frame to change in buffers
         if int_time > 0:
             azcam.log("Integrating", level=1)
+        delay = self.poll_delay_min
+        frame_keys = ("BUF1FRAME", "BUF2FRAME", "BUF3FRAME")
+        currframes = (self.currframe1, self.currframe2, self.currframe3)
         while stop == 0:
             # Get frame and update frame dictionary
             self.get_frame()
 
             # Check in a new frame is available
-            if self.currframe1 != self.dict_frame["BUF1FRAME"]:
-                self.newframe = 1
-                stop = 1
-
-            if self.currframe2 != self.dict_frame["BUF2FRAME"]:
-                self.newframe = 2
-                stop = 1
-
-            if self.currframe3 != self.dict_frame["BUF3FRAME"]:
-                self.newframe = 3
-                stop = 1
-
-            if int_time > 0:
-                pass
-                # azcam.log(f"Integrating: {(time.time() - self.exp_start):.1f} secs", level=2)
+            for buffer, (key, currframe) in enumerate(zip(frame_keys, currframes), 1):
+                if self.frame_ints[key] != currframe:
+                    self.newframe = buffer
+                    stop = 1
+                    break
 
             # check for abort
             if (
@@ -1529,15 +1424,14 @@ class ControllerArchon(Controller):
             ):
                 stop = 1
 
-            # Check if time out occured
             if not stop:
-                if 0:  # 0 is no timeout
-                    if time.time() > (self.frame_time + int_time + 90):  # long for 10k
-                        self.newframe = -1
-                        self.read_buffer = -1
-                        azcam.exceptions.warning("Timed out waiting for integration")
-                        stop = 1
-                time.sleep(0.5)
+                # sleep until the expected end of integration, then back off
+                remaining = self.exp_start + int_time - time.time()
+                if remaining > 0:
+                    time.sleep(min(remaining, 0.5))
+                else:
+                    time.sleep(delay)
+                    delay = min(delay * 1.5, self.poll_delay_max)
 
         # check for abort
         if (
@@ -1554,6 +1448,7 @@ class ControllerArchon(Controller):
         ].exposureflags["READOUT"]
 
         self.read_buffer = self.newframe
+        self.readout_geometry = None
 
         # Wait for readout to complete
         azcam.log("Reading", level=1)
@@ -1562,26 +1457,21 @@ class ControllerArchon(Controller):
             raise azcam.exceptions.AzcamError("New frame is not ready")
 
         self.read_time = time.time()
-        frameStatus = "BUF%dCOMPLETE" % (self.read_buffer)
+        frameStatus = f"BUF{self.read_buffer}COMPLETE"
         dataReady = 0
-        cnt = 0
+        delay = self.poll_delay_min
 
-        while dataReady == 0 and cnt < 500:
+        while dataReady == 0 and time.time() - self.read_time < 250:
             # Get frame and update frame dictionary
-            time.sleep(0.50)
+            time.sleep(delay)
+            delay = min(delay * 1.5, self.poll_delay_max)
             self.get_frame()
 
             # Check if frame is ready
-            ready = self.dict_frame[frameStatus]
-            if int(ready) == 1:
+            if self.frame_ints[frameStatus] == 1:
                 dataReady = 1
-            else:
-                cnt += 1
 
-            if 1:
-                azcam.log(
-                    f"Reading: {(time.time() - self.read_time):.1f} secs", level=2
-                )
+            azcam.log(f"Reading: {(time.time() - self.read_time):.1f} secs", level=2)
 
             # check for abort
             if (
@@ -1594,8 +1484,8 @@ class ControllerArchon(Controller):
         # record actual exposure time - archon time stamp valid for INT only
         et = 0
         if self.int_ms > 0:
-            t1 = int(self.dict_frame[f"BUF{self.read_buffer}RETIMESTAMP"], 16)
-            t2 = int(self.dict_frame[f"BUF{self.read_buffer}FETIMESTAMP"], 16)
+            t1 = self.frame_ints[f"BUF{self.read_buffer}RETIMESTAMP"]
+            t2 = self.frame_ints[f"BUF{self.read_buffer}FETIMESTAMP"]
             et = (t2 - t1) / 1.0e8
         elif self.noint_ms > 0:
             et = self.noint_ms / 1000.0
@@ -1617,24 +1507,31 @@ class ControllerArchon(Controller):
         Downloads config data from the Archon controller.
         """
 
-        cnt = 0x0000
-
-        self.ConfigArchon = []
+        self.ConfigArchon = self.read_config_lines()
+        self.ConfigArchonCnt = len(self.ConfigArchon)
 
-        endCfg = 0
+        return
 
-        while endCfg != 1:
-            cmd = "RCONFIG%04X" % (cnt & 0xFFFF)
-            reply = self.archon_command(cmd)
-            cnt += 1
-            if len(reply) > 0:
-                self.ConfigArchon.append(reply[1])
-            else:
-                endCfg = 1
+    def read_config_lines(self):
+        """
+        Read all configuration lines from the Archon controller.
+        RCONFIG requests are pipelined CONFIG_BATCH_SIZE at a time and reading
+        stops at the first empty reply, which marks the end of the config data.
+        """
 
-        self.ConfigArchonCnt = len(self.ConfigArchon)
+        lines = []
+        cnt = 0x0000
 
-        return
+        while True:
+            cmds = [
+                f"RCONFIG{(cnt + i) & 0xFFFF:04X}"
+                for i in range(self.CONFIG_BATCH_SIZE)
+            ]
+            for reply in self.archon_command_batch(cmds):
+                if len(reply) == 0:
+                    return lines
+                lines.append(reply)
+            cnt += self.CONFIG_BATCH_SIZE
 
     def resettiming(self):
         """
@@ -1722,18 +1619,9 @@ class ControllerArchon(Controller):
             # raise azcam.exceptions.AzcamError("Configuration data not loaded")
             return
 
-        # update config dictionary
-        for par in roi_pars:
-            self.dict_config[self.dict_params[par]] = f"{par}={roi_pars[par]}"
-
-            # update Archon value
-            indxParam = self.dict_wconfig[self.dict_params[par]]
-            cmd = "WCONFIG%04X%s=%s" % (
-                indxParam & 0xFFFF,
-                self.dict_params[par],
-                f"{par}={roi_pars[par]}",
-            )
-            self.archon_command(cmd)
+        # update config dictionary and Archon values
+        cmds = [self._param_command(par, value) for par, value in roi_pars.items()]
+        self.archon_command_batch(cmds)
 
         # also update pixelcount and linecount (per tap)
         pixelcount = (
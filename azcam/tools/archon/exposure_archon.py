@@ -42,9 +42,11 @@ class ExposureArchon(Exposure):
         azcam.db.tools["controller"].resettiming()
 
         azcam.db.abortflag = 1
+        self.abort_event.set()
 
         if self.exposure_flag != self.exposureflags["NONE"]:
             self.exposure_flag = self.exposureflags["ABORT"]
+            self.flag_event.set()
 
         return
 
@@ -55,6 +57,7 @@ class ExposureArchon(Exposure):
 
         if self.exposure_flag != self.exposureflags["NONE"]:
             self.exposure_flag = self.exposureflags["READ"]
+            self.flag_event.set()
 
         azcam.db.tools["controller"].archon_command("FASTLOADPARAM StopExposure 1")
         time.sleep(0.1)
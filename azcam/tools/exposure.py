@@ -31,6 +31,29 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
     which should inherit this class.
     """
 
+    # exposure flag values used for exposure control, also in exposureflags
+    FLAG_NONE = 0
+    FLAG_ABORT = 2
+    FLAG_PAUSE = 3
+    FLAG_RESUME = 4
+    FLAG_READ = 5
+    FLAG_SETUP = 8
+
+    # sensor data keys used by set_detpars(), {key: (setter name, unpack value)}
+    DETPARS_SETTERS = {
+        "ref_pixel": ("set_ref_pixel", False),
+        "format": ("set_format", True),
+        "focalplane": ("set_focalplane", True),
+        "roi": ("set_roi", True),
+        "ext_position": ("set_extension_position", False),
+        "jpg_order": ("set_jpg_order", False),
+        "det_number": ("set_detnum", False),
+        "det_position": ("set_detpos", False),
+        "det_gap": ("set_detgap", False),
+        "ext_name": ("set_extname", False),
+        "ext_number": ("set_extnum", False),
+    }
+
     def __init__(self, tool_id="exposure", description=None):
         Tools.__init__(self, tool_id, description)
         Filename.__init__(self)
@@ -41,15 +64,15 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
 
         # exposure flags, may be used anywhere
         self.exposureflags = {
-            "NONE": 0,
+            "NONE": self.FLAG_NONE,
             "EXPOSING": 1,
-            "ABORT": 2,
-            "PAUSE": 3,
-            "RESUME": 4,
-            "READ": 5,
+            "ABORT": self.FLAG_ABORT,
+            "PAUSE": self.FLAG_PAUSE,
+            "RESUME": self.FLAG_RESUME,
+            "READ": self.FLAG_READ,
             "PAUSED": 6,
             "READOUT": 7,
-            "SETUP": 8,
+            "SETUP": self.FLAG_SETUP,
             "WRITING": 9,
             "GUIDEERROR": 10,
             "ERROR": 11,
@@ -60,7 +83,7 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         self.exposureflags_rev = {v: k for k, v in self.exposureflags.items()}
 
         # exposure flag defining state of current exposure
-        self.exposure_flag = self.exposureflags["NONE"]
+        self.exposure_flag = self.FLAG_NONE
 
         # current image type, 'zero', 'object', 'dark', 'flat', 'ramp', etc
         self.image_type = "zero"
@@ -113,7 +136,7 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         self.exposure_time_saved = 0.0
         # total time in seconds an exposure was paused
         self.paused_time = 0.0
-        # starting clock paused time of exposure
+        # starting monotonic clock paused time of exposure
         self.paused_time_start = 0.0
         # actual elapsed dark time of last/current exposure
         self.dark_time = 0.0
@@ -130,6 +153,10 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         self.exposure_sequence_delay = 0.0
         # sequence flush flag: -1=> use FlushArray, 0==> flush all, 1=> flush only first exposure, 2=> no flush
         self.exposure_sequence_flush = 0
+        # set by abort() to end a sequence delay early
+        self.abort_event = threading.Event()
+        # set when exposure_flag is changed by abort, readout, pause or resume
+        self.flag_event = threading.Event()
 
         # remaining number of pixels to read for an exposure in progress
         self.pixels_remaining = 0
@@ -168,6 +195,10 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
 
         # flag indicating ROI has been changed
         self.new_roi = 0
+        # ROI last applied by set_roi(), None after a format or focalplane change
+        self.roi_key = None
+        # image data buffer, reused while its shape does not change
+        self.data_buffer = None
         self.header.set_header("exposure", 1)
 
         # data order
@@ -182,9 +213,9 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         Initialize exposure.
         """
 
-        # call initialize() method on other tools
-        for tool in azcam.db.tools_init:
-            azcam.db.tools[tool].initialize()
+        # call initialize() method on other tools, which register themselves
+        for tool in azcam.db.tools_init.values():
+            tool.initialize()
 
         self.is_initialized = 1
 
@@ -208,12 +239,13 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         self.set_auto_title()
         azcam.db.abortflag = 0
         self.save_file = 1
-        self.exposure_flag = self.exposureflags["NONE"]
+        self.exposure_flag = self.FLAG_NONE
+        self.roi_key = None
 
-        # call reset() method on other tools
-        for tool in azcam.db.tools_reset:
+        # call reset() method on other tools, which register themselves
+        for tool, tool_object in azcam.db.tools_reset.items():
             try:
-                azcam.db.tools[tool].reset()
+                tool_object.reset()
             except Exception as e:
                 raise azcam.exceptions.AzcamError(f"Could not reset {tool}: {e}")
 
@@ -228,14 +260,13 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         Allow custom operations at start of exposure.
         """
 
-        try:
-            azcam.db.tools["instrument"].exposure_start()
-        except KeyError:
-            pass
-        try:
-            azcam.db.tools["telescope"].exposure_start()
-        except KeyError:
-            pass
+        tools = azcam.db.tools
+        instrument = tools.get("instrument")
+        if instrument is not None:
+            instrument.exposure_start()
+        telescope = tools.get("telescope")
+        if telescope is not None:
+            telescope.exposure_start()
 
         return
 
@@ -244,22 +275,18 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         Allow custom operations at end of exposure.
         """
 
-        try:
-            azcam.db.tools["instrument"].exposure_finish()
-        except KeyError:
-            pass
-        try:
-            azcam.db.tools["telescope"].exposure_finish()
-        except KeyError:
-            pass
+        tools = azcam.db.tools
+        instrument = tools.get("instrument")
+        if instrument is not None:
+            instrument.exposure_finish()
+        telescope = tools.get("telescope")
+        if telescope is not None:
+            telescope.exposure_finish()
 
         return
 
     def finished(self):
-        if self.completed:
-            return 1
-        else:
-            return 0
+        return int(self.completed)
 
     def get_exposureflag(self):
         return [self.exposure_flag, self.exposureflags_rev[self.exposure_flag]]
@@ -309,31 +336,31 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         azcam.log("Exposure started")
 
         # if last exposure was aborted, warn before clearing flag
-        if self.exposure_flag == self.exposureflags["ABORT"]:
+        if self.exposure_flag == self.FLAG_ABORT:
             azcam.exceptions.warning("Previous exposure was aborted")
 
         # begin
-        if self.exposure_flag != self.exposureflags["ABORT"]:
+        if self.exposure_flag != self.FLAG_ABORT:
             self.begin(exposure_time, imagetype, title)
 
         # integrate
-        if self.exposure_flag != self.exposureflags["ABORT"]:
+        if self.exposure_flag != self.FLAG_ABORT:
             self.integrate()
 
         # readout
         if (
-            self.exposure_flag != self.exposureflags["ABORT"]
-            and self.exposure_flag == self.exposureflags["READ"]
+            self.exposure_flag != self.FLAG_ABORT
+            and self.exposure_flag == self.FLAG_READ
         ):
             try:
                 self.readout()
             except azcam.exceptions.AzcamError:
                 pass
         # end
-        if self.exposure_flag != self.exposureflags["ABORT"]:
+        if self.exposure_flag != self.FLAG_ABORT:
             self.end()
 
-        self.exposure_flag = self.exposureflags["NONE"]
+        self.exposure_flag = self.FLAG_NONE
         self.completed = 1
         azcam.log("Exposure finished")
 
@@ -353,9 +380,7 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         :param image_title: image title, usually surrounded by double quotes
         """
 
-        arglist = [exposure_time, image_type, image_title]
-        thread = threading.Thread(target=self.expose, name="expose1", args=arglist)
-        thread.start()
+        self.start_thread(self.expose, exposure_time, image_type, image_title)
 
         return
 
@@ -370,51 +395,32 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         number_exposures = int(number_exposures)
 
         # system must be reset once before an exposure can be made
-        if not azcam.db.tools["controller"].is_reset:
-            azcam.db.tools["controller"].reset()
+        controller = azcam.db.tools["controller"]
+        if not controller.is_reset:
+            controller.reset()
 
         # parameters for faster operation
         flusharray = self.flush_array
         azcam.log("Guide started")
 
+        # bind for the loop
+        expose = self.expose
+        abort_event = self.abort_event
+        abort_event.clear()
+
         # this loop continues even for errors since data is sent to a seperate client receiving images
         LoopCount = 0
         while True:
-            if 0:
-                self.begin(exposure_time=-1, imagetype="object", title="guide image")
-
-                # integrate
-                self.integrate()
-
-                # readout
-                if self.exposure_flag == self.exposureflags["READ"]:
-                    try:
-                        self.readout()
-                        self.guide_status = 1  # image read OK
-                        self.guide_image_copy = self.image
-                    except Exception:
-                        self.guide_status = (
-                            2  # image not read OK, but don't stop guide loop
-                        )
-                        self.image = self.guide_image_copy
-
-                # image writing
-                self.end()
-                self.exposure_flag = self.exposureflags["NONE"]
-            else:
-                self.expose(-1, "object", "guide image")
+            expose(-1, "object", "guide image")
 
-            AbortFlag = azcam.db.abortflag
+            AbortFlag = azcam.db.abortflag or abort_event.is_set()
             if AbortFlag:
                 break
 
-            if number_exposures == -1:
-                continue
-            else:
+            if number_exposures != -1:
                 LoopCount += 1
-
-            if LoopCount >= number_exposures:
-                break
+                if LoopCount >= number_exposures:
+                    break
 
         # finish
         self.guide_status = 0
@@ -433,9 +439,7 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         NumberExposures is the number of exposures to make, -1 loop forever
         """
 
-        arglist = [number_exposures]
-        thread = threading.Thread(target=self.guide, name="guide1", args=arglist)
-        thread.start()
+        self.start_thread(self.guide, number_exposures, dedicated=True)
 
         return
 
@@ -446,14 +450,16 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         imagetype is one of zero, object, flat, dark, ramp, ...
         """
 
+        controller = azcam.db.tools["controller"]
+
         # system must be reset once before an exposure can be made
         x = self.is_exposure_sequence  # save this flag which is lost by reset
-        if not azcam.db.tools["controller"].is_reset:
+        if not controller.is_reset:
             self.reset()
             self.is_exposure_sequence = x
 
         # set exposure flag
-        self.exposure_flag = self.exposureflags["SETUP"]
+        self.exposure_flag = self.FLAG_SETUP
 
         # reset flags as new data coming
         self.image.valid = 0
@@ -466,19 +472,18 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         self.image.header.delete_all_keywords()
 
         # update image size
-        try:
-            self.set_roi()  # bug?
-        except Exception:
-            pass
+        if self.can_set_roi():
+            self.set_roi()
 
         if self.new_roi:
-            self.image.data = numpy.empty(
-                shape=[
-                    self.image.focalplane.numamps_image,
-                    self.image.focalplane.numpix_amp,
-                ],
-                dtype="<u2",
+            shape = (
+                self.image.focalplane.numamps_image,
+                self.image.focalplane.numpix_amp,
             )
+            # data is always overwritten by readout so no need to clear buffer
+            if self.data_buffer is None or self.data_buffer.shape != shape:
+                self.data_buffer = numpy.empty(shape=shape, dtype="uint16")
+            self.image.data = self.data_buffer
             self.new_roi = 0
 
         # imagetype
@@ -508,49 +513,42 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         self.pixels_remaining = self.image.focalplane.numpix_image
 
         # set CompExposure flag for any undefined image types (comp names)
-        if imagetype not in self.image_types:
-            self.comp_exposure = 1
-        else:
-            self.comp_exposure = 0
+        self.comp_exposure = int(imagetype not in self.image_types)
 
         if not self.guide_mode:  # for speed
-            try:
-                shutterstate = self.shutter_dict[imagetype]
-            except KeyError:
-                shutterstate = 1  # other types are comps, so open shutter
-            azcam.db.tools["controller"].set_shutter_state(shutterstate)
+            # other types are comps, so open shutter
+            controller.set_shutter_state(self.shutter_dict.get(imagetype, 1))
 
         self.delete_keyword("COMPLAMP")
 
         # set comp lamps, turn on, set keyword
-        if self.comp_exposure and azcam.db.tools["instrument"].is_enabled:
+        imagetyp = None
+        instrument = azcam.db.tools.get("instrument")
+        instrument_enabled = instrument is not None and instrument.is_enabled
+        if self.comp_exposure and instrument_enabled:
             if self.comp_sequence:  # lamps already on
                 pass
             else:
-                azcam.db.tools["instrument"].set_comps(imagetype)
-                if not azcam.db.tools["instrument"].shutter_strobe:
-                    azcam.db.tools["instrument"].comps_on()
-            lampnames = " ".join(azcam.db.tools["instrument"].get_comps())
+                instrument.set_comps(imagetype)
+                if not instrument.shutter_strobe:
+                    instrument.comps_on()
+            lampnames = " ".join(instrument.get_comps())
             self.set_keyword("COMPLAMP", lampnames, "Comp lamp names", "str")
-            self.set_keyword("IMAGETYP", "comp", "Image type", "str")
-            azcam.db.tools["instrument"].comps_delay()  # delay for lamp warmup
+            imagetyp = "comp"
+            instrument.comps_delay()  # delay for lamp warmup
         else:
             if not self.guide_mode:
-                try:
-                    if (azcam.db.tools["instrument"] is not None) and azcam.db.tools[
-                        "instrument"
-                    ].is_enabled:
-                        azcam.db.tools["instrument"].set_comps()  # reset
-                except KeyError:
-                    pass
-                self.set_keyword("IMAGETYP", imagetype, "Image type", "str")
+                if instrument_enabled:
+                    instrument.set_comps()  # reset
+                imagetyp = imagetype
+
+        # IMAGETYP is written once, not set in guide mode except for comps
+        if imagetyp is not None:
+            self.set_keyword("IMAGETYP", imagetyp, "Image type", "str")
 
         # update all headers with current data
         if self.update_headers_in_background:
-            headerthread = threading.Thread(
-                target=self.update_headers, name="updateheaders", args=[]
-            )
-            headerthread.start()
+            self.start_thread(self.update_headers)
         else:
             self.update_headers()
 
@@ -558,7 +556,7 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         if self.flush_array:
             self.flush()
         else:
-            azcam.db.tools["controller"].stop_idle()
+            controller.stop_idle()
 
         # record current time and date in header
         self.record_current_times()
@@ -593,8 +591,9 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         Really sets a flag which is read in expose().
         """
 
-        if self.exposure_flag != self.exposureflags["NONE"]:
-            self.exposure_flag = self.exposureflags["READ"]
+        if self.exposure_flag != self.FLAG_NONE:
+            self.exposure_flag = self.FLAG_READ
+            self.flag_event.set()
 
         return
 
@@ -622,24 +621,26 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         -1 => no change
         """
 
-        AbortFlag = 0
         self.is_exposure_sequence = 1
         self.exposure_sequence_number = 1
+        self.abort_event.clear()
 
-        # number exposures in sequence
+        # arguments may be strings from a command server
         number_exposures = int(number_exposures)
+        flush_array_flag = int(flush_array_flag)
+        delay = float(delay)
+
+        # number exposures in sequence
         if number_exposures == -1:
             number_exposures = self.exposure_sequence_total
         else:
             self.exposure_sequence_total = number_exposures
 
         # delay between exposures
-        if int(delay) == -1:
-            delay = self.exposure_sequence_delay
-        delay = float(delay)
+        if delay == -1:
+            delay = float(self.exposure_sequence_delay)
 
         # flushing
-        flush_array_flag = int(flush_array_flag)
         currentflush = self.flush_array
         if flush_array_flag == -1:
             flush_array_flag = self.exposure_sequence_flush
@@ -657,18 +658,19 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
 
         if self.comp_sequence:
             azcam.log("Starting comparison sequence")
-            azcam.db.tools["instrument"].set_comps(self.image_type)
-            if azcam.db.tools["instrument"].shutter_strobe:
+            instrument = azcam.db.tools["instrument"]
+            instrument.set_comps(self.image_type)
+            if instrument.shutter_strobe:
                 pass  # these instruments use shutter to turn on comps
             else:
-                azcam.db.tools["instrument"].comps_on()
-            azcam.db.tools[
-                "instrument"
-            ].comps_delay()  # delay for lamp warmup if needed
+                instrument.comps_on()
+            instrument.comps_delay()  # delay for lamp warmup if needed
 
         for i in range(number_exposures):
-            if i > 0:
-                time.sleep(self.exposure_sequence_delay)
+            if i > 0 and delay > 0:
+                # wait for the delay or until an abort arrives
+                if self.abort_event.wait(delay) or azcam.db.abortflag:
+                    break
 
             if i > 0 and flush_array_flag == 1:
                 self.flush_array = False
@@ -712,9 +714,32 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         -1 => no change
         """
 
-        arglist = [number_exposures, flush_array_flag, delay]
-        thread = threading.Thread(target=self.sequence, name="sequence1", args=arglist)
-        thread.start()
+        self.start_thread(
+            self.sequence, number_exposures, flush_array_flag, delay, dedicated=True
+        )
+
+        return
+
+    def start_thread(self, target, *args, dedicated=False):
+        """
+        Run target(*args) in a shared worker thread and return immediately.
+        Long running loops should set dedicated to run in their own thread.
+        Errors are logged since there is no caller to receive them.
+        """
+
+        def run():
+            try:
+                target(*args)
+            except Exception as error:
+                azcam.log(f"{target.__name__} failed: {error}")
+
+        if dedicated:
+            thread = threading.Thread(
+                target=run, name=f"azcam-{target.__name__}", daemon=True
+            )
+            thread.start()
+        else:
+            azcam.utils.get_executor("exposure", 4).submit(run)
 
         return
 
@@ -724,10 +749,11 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         Really sets a flag which is read in expose().
         """
 
-        self.paused_time_start = time.time()  # save paused clock time
+        self.paused_time_start = time.monotonic()  # save paused clock time
 
-        if self.exposure_flag != self.exposureflags["NONE"]:
-            self.exposure_flag = self.exposureflags["PAUSE"]
+        if self.exposure_flag != self.FLAG_NONE:
+            self.exposure_flag = self.FLAG_PAUSE
+            self.flag_event.set()
 
         return
 
@@ -738,11 +764,12 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         """
 
         self.paused_time = (
-            time.time() - self.paused_time_start
+            time.monotonic() - self.paused_time_start
         ) + self.paused_time  # total paused time in seconds
 
-        if self.exposure_flag != self.exposureflags["NONE"]:
-            self.exposure_flag = self.exposureflags["RESUME"]
+        if self.exposure_flag != self.FLAG_NONE:
+            self.exposure_flag = self.FLAG_RESUME
+            self.flag_event.set()
 
         return
 
@@ -752,8 +779,11 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         Really sets a flag which is read in expose().
         """
 
-        if self.exposure_flag != self.exposureflags["NONE"]:
-            self.exposure_flag = self.exposureflags["ABORT"]
+        self.abort_event.set()
+
+        if self.exposure_flag != self.FLAG_NONE:
+            self.exposure_flag = self.FLAG_ABORT
+            self.flag_event.set()
 
         return
 
@@ -856,35 +886,26 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         """
 
         # get current time and date
-        self.obstime.update(0)
+        obstime = self.obstime
+        obstime.update(0)
+        date = obstime.date[0]
+        ut = obstime.ut[0]
+        time_system = obstime.time_system[0]
+        time_zone = obstime.time_zone[0]
+        local_time = obstime.local_time[0]
 
         # format should be YYYY-MM-DDThh:mm:ss.sss  ISO 8601
-        self.header.set_keyword(
-            "DATE-OBS", self.obstime.date[0], "UTC shutter opened", "str"
-        )
-        self.header.set_keyword(
-            "DATE", self.obstime.date[0], "UTC date and time file writtten", "str"
-        )  # OLD
-        self.header.set_keyword(
-            "TIME-OBS", self.obstime.ut[0], "UTC at start of exposure", "str"
-        )
-        self.header.set_keyword(
-            "UTC-OBS", self.obstime.ut[0], "UTC at start of exposure", "str"
-        )
-        self.header.set_keyword(
-            "UT", self.obstime.ut[0], "UTC at start of exposure", "str"
-        )
-        self.header.set_keyword(
-            "TIMESYS", self.obstime.time_system[0], "Time system", "str"
-        )
-        self.header.set_keyword(
-            "TIMEZONE", self.obstime.time_zone[0], "Local time zone", "str"
-        )
-        self.header.set_keyword(
-            "LOCTIME",
-            self.obstime.local_time[0],
-            "Local time at start of exposure",
-            "str",
+        self.header.set_keywords(
+            [
+                ("DATE-OBS", date, "UTC shutter opened", "str"),
+                ("DATE", date, "UTC date and time file writtten", "str"),  # OLD
+                ("TIME-OBS", ut, "UTC at start of exposure", "str"),
+                ("UTC-OBS", ut, "UTC at start of exposure", "str"),
+                ("UT", ut, "UTC at start of exposure", "str"),
+                ("TIMESYS", time_system, "Time system", "str"),
+                ("TIMEZONE", time_zone, "Local time zone", "str"),
+                ("LOCTIME", local_time, "Local time at start of exposure", "str"),
+            ]
         )
 
         return
@@ -898,6 +919,9 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         self.updating_header = 1
 
         # all headers to be updated must be in azcam.db['headers']
+        # tools which share no connection are read concurrently, others in turn
+        futures = {}
+        serial = []
         for objectname in azcam.db.headers:
             if (
                 objectname == "controller"
@@ -907,9 +931,24 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
             ):
                 continue
             try:
-                azcam.db.tools[
-                    objectname
-                ].update_header()  # dont crash so all headers get updated
+                tool = azcam.db.tools[objectname]
+                if getattr(tool, "header_update_concurrent", 0):
+                    executor = azcam.utils.get_executor("header", 8)
+                    futures[objectname] = executor.submit(tool.update_header)
+                else:
+                    serial.append((objectname, tool))
+            except Exception as e:
+                azcam.log(f"could not get {objectname} header: {e}")
+
+        for objectname, tool in serial:
+            try:
+                tool.update_header()  # dont crash so all headers get updated
+            except Exception as e:
+                azcam.log(f"could not get {objectname} header: {e}")
+
+        for objectname, future in futures.items():
+            try:
+                future.result()  # dont crash so all headers get updated
             except Exception as e:
                 azcam.log(f"could not get {objectname} header: {e}")
 
@@ -957,17 +996,14 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
                 title = self.title
 
         if self.auto_title:
-            if (
-                self.image_type.lower() == "object"
-            ):  # don't change object title in AutoTitle mode
-                pass
-            else:
-                # if title == "":
-                #     title = self.image_type.lower()
-                title = self.image_type.lower()
-
-        # set OBJECT keyword to title or autotitle value
-        self.set_keyword("OBJECT", title, "", "str")
+            imagetype = self.image_type.lower()
+            # don't change object title in AutoTitle mode
+            if imagetype != "object":
+                title = imagetype
+
+        # set OBJECT keyword to title or autotitle value, unless already set
+        if self.header.values.get("OBJECT") != title:
+            self.set_keyword("OBJECT", title, "", "str")
         self.title = title
         self.image.title = title
 
@@ -1000,11 +1036,11 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         An image is ready when written to disk if SaveFile is true, or when valid if SaveFile is false.
         """
 
-        if self.image.toggle:
-            self.image.toggle = 0
-            return 1
-        else:
-            return 0
+        image = self.image
+        toggle = image.toggle
+        image.toggle = 0
+
+        return int(toggle)
 
     def get_image_type(self):
         """
@@ -1087,28 +1123,14 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
 
         detpars = sensor_data
 
-        if detpars.get("ref_pixel"):
-            self.set_ref_pixel(detpars["ref_pixel"])
-        if detpars.get("format"):
-            self.set_format(*detpars["format"])
-        if detpars.get("focalplane"):
-            self.set_focalplane(*detpars["focalplane"])
-        if detpars.get("roi"):
-            self.set_roi(*detpars["roi"])
-        if detpars.get("ext_position"):
-            self.set_extension_position(detpars["ext_position"])
-        if detpars.get("jpg_order"):
-            self.set_jpg_order(detpars["jpg_order"])
-        if detpars.get("det_number"):
-            self.set_detnum(detpars["det_number"])
-        if detpars.get("det_position"):
-            self.set_detpos(detpars["det_position"])
-        if detpars.get("det_gap"):
-            self.set_detgap(detpars["det_gap"])
-        if detpars.get("ext_name"):
-            self.set_extname(detpars["ext_name"])
-        if detpars.get("ext_number"):
-            self.set_extnum(detpars["ext_number"])
+        # setters are called in table order as set_roi() needs format and focalplane
+        for key, (setter, unpack) in self.DETPARS_SETTERS.items():
+            value = detpars.get(key)
+            if value:
+                if unpack:
+                    getattr(self, setter)(*value)
+                else:
+                    getattr(self, setter)(value)
 
         if detpars.get("ctype"):
             self.image.focalplane.wcs.ctype1 = detpars["ctype"][0]
@@ -1155,30 +1177,11 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
             np_frametransfer,
         )
 
-        # update controller parameters
-        controller = azcam.db.tools["controller"]
-        controller.detpars.ns_total = self.image.focalplane.ns_total
-        controller.detpars.ns_predark = self.image.focalplane.ns_predark
-        controller.detpars.ns_underscan = self.image.focalplane.ns_underscan
-        controller.detpars.ns_overscan = self.image.focalplane.ns_overscan
-        controller.detpars.np_total = self.image.focalplane.np_total
-        controller.detpars.np_predark = self.image.focalplane.np_predark
-        controller.detpars.np_underscan = self.image.focalplane.np_underscan
-        controller.detpars.np_overscan = self.image.focalplane.np_overscan
-        controller.detpars.np_frametransfer = self.image.focalplane.np_frametransfer
-        controller.detpars.coltotal = self.image.focalplane.ns_total
-        controller.detpars.colusct = self.image.focalplane.ns_predark
-        controller.detpars.coluscw = self.image.focalplane.ns_underscan
-        controller.detpars.coluscm = 0
-        controller.detpars.coloscw = self.image.focalplane.ns_overscan
-        controller.detpars.coloscm = 0
-        controller.detpars.rowtotal = self.image.focalplane.np_total
-        controller.detpars.rowusct = self.image.focalplane.np_predark
-        controller.detpars.rowuscw = self.image.focalplane.np_underscan
-        controller.detpars.rowuscm = 0
-        controller.detpars.rowoscw = self.image.focalplane.np_overscan
-        controller.detpars.rowoscm = 0
-        controller.detpars.framet = self.image.focalplane.np_frametransfer
+        # controller shares the focalplane as its detector parameters
+        azcam.db.tools["controller"].detpars = self.image.focalplane
+
+        # ROI must be recalculated
+        self.roi_key = None
 
         return
 
@@ -1221,20 +1224,11 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
             numdet_x, numdet_y, numamps_x, numamps_y, amp_cfg
         )
 
-        # update controller parameters
-        controller = azcam.db.tools["controller"]
-        controller.detpars.numdet_x = self.image.focalplane.numdet_x
-        controller.detpars.numdet_y = self.image.focalplane.numdet_y
-        controller.detpars.numamps_x = self.image.focalplane.numamps_x
-        controller.detpars.numamps_y = self.image.focalplane.numamps_y
-        controller.detpars.amp_cfg = self.image.focalplane.amp_cfg
-        controller.detpars.num_detectors = self.image.focalplane.num_detectors
-        controller.detpars.num_ser_amps_det = self.image.focalplane.num_ser_amps_det
-        controller.detpars.num_par_amps_det = self.image.focalplane.num_par_amps_det
-        controller.detpars.num_amps_det = self.image.focalplane.num_amps_det
-        controller.detpars.numamps_image = self.image.focalplane.numamps_image
-        controller.detpars.ampvispix_x = self.image.focalplane.ampvispix_x
-        controller.detpars.ampvispix_y = self.image.focalplane.ampvispix_y
+        # controller shares the focalplane as its detector parameters
+        azcam.db.tools["controller"].detpars = self.image.focalplane
+
+        # ROI must be recalculated
+        self.roi_key = None
 
         self.image.set_scaling()
 
@@ -1252,10 +1246,10 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         Sets data order
         """
 
-        self.data_order = []
-        if len(dataOrder) > 0:
-            for item in dataOrder:
-                self.data_order.append(int(item))
+        # index array used directly to deinterlace image data
+        self.data_order = numpy.array(
+            [int(item) for item in dataOrder], dtype=numpy.intp
+        )
 
         return
 
@@ -1283,66 +1277,68 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         col_bin = int(col_bin)
         row_bin = int(row_bin)
         roi_num = int(roi_num)
-        self.image.focalplane.set_roi(
+
+        # skip recalculation when the ROI is unchanged, but always update the
+        # controller since a reset or config reload may have cleared its ROI
+        focalplane = self.image.focalplane
+        controller = azcam.db.tools["controller"]
+        roi = (first_col, last_col, first_row, last_row, col_bin, row_bin)
+        current = (
+            focalplane.first_col,
+            focalplane.last_col,
+            focalplane.first_row,
+            focalplane.last_row,
+            focalplane.col_bin,
+            focalplane.row_bin,
+        )
+        key = tuple(c if r == -1 else r for r, c in zip(roi, current)) + (roi_num,)
+        if key == self.roi_key:
+            controller.set_roi()
+            return
+
+        focalplane.set_roi(
             first_col, last_col, first_row, last_row, col_bin, row_bin, roi_num
         )
 
-        # update controller parameters
-        controller = azcam.db.tools["controller"]
-        controller.detpars.first_col = self.image.focalplane.first_col
-        controller.detpars.last_col = self.image.focalplane.last_col
-        controller.detpars.first_row = self.image.focalplane.first_row
-        controller.detpars.last_row = self.image.focalplane.last_row
-        controller.detpars.col_bin = self.image.focalplane.col_bin
-        controller.detpars.row_bin = self.image.focalplane.row_bin
-
-        controller.detpars.xunderscan = self.image.focalplane.xunderscan
-        controller.detpars.xskip = self.image.focalplane.xskip
-        controller.detpars.xpreskip = self.image.focalplane.xpreskip
-        controller.detpars.xdata = self.image.focalplane.xdata
-        controller.detpars.xpostskip = self.image.focalplane.xpostskip
-        controller.detpars.xoverscan = self.image.focalplane.xoverscan
-        controller.detpars.yunderscan = self.image.focalplane.yunderscan
-        controller.detpars.yskip = self.image.focalplane.yskip
-        controller.detpars.ypreskip = self.image.focalplane.ypreskip
-        controller.detpars.ydata = self.image.focalplane.ydata
-        controller.detpars.ypostskip = self.image.focalplane.ypostskip
-        controller.detpars.yoverscan = self.image.focalplane.yoverscan
-
-        controller.detpars.numcols_amp = self.image.focalplane.numcols_amp
-        controller.detpars.numcols_overscan = self.image.focalplane.numcols_overscan
-        controller.detpars.numviscols_amp = self.image.focalplane.numviscols_amp
-        controller.detpars.numviscols_image = self.image.focalplane.numviscols_image
-        controller.detpars.numrows_amp = self.image.focalplane.numrows_amp
-        controller.detpars.numrows_overscan = self.image.focalplane.numrows_overscan
-        controller.detpars.numvisrows_amp = self.image.focalplane.numvisrows_amp
-        controller.detpars.numvisrows_image = self.image.focalplane.numvisrows_image
-        controller.detpars.numpix_amp = self.image.focalplane.numpix_amp
-        controller.detpars.numcols_det = self.image.focalplane.numcols_det
-        controller.detpars.numrows_det = self.image.focalplane.numrows_det
-        controller.detpars.numpix_det = self.image.focalplane.numpix_det
-        controller.detpars.numpix_image = self.image.focalplane.numpix_image
-        controller.detpars.numcols_image = self.image.focalplane.numcols_image
-        controller.detpars.numrows_image = self.image.focalplane.numrows_image
-        controller.detpars.numbytes_image = self.image.focalplane.numbytes_image
-        controller.detpars.xflush = self.image.focalplane.xflush
-        controller.detpars.yflush = self.image.focalplane.yflush
+        # controller shares the focalplane as its detector parameters
+        controller.detpars = focalplane
 
         # update controller
         controller.set_roi()
 
         # update image size
-        self.size_x = self.image.focalplane.numcols_image
-        self.size_y = self.image.focalplane.numrows_image
+        self.size_x = focalplane.numcols_image
+        self.size_y = focalplane.numrows_image
 
-        self.image.size_x = self.image.focalplane.numcols_image
-        self.image.size_y = self.image.focalplane.numrows_image
+        self.image.size_x = focalplane.numcols_image
+        self.image.size_y = focalplane.numrows_image
 
         # indicate that ROI has changed for next exposure
         self.new_roi = 1
+        self.roi_key = key
 
         return
 
+    def can_set_roi(self):
+        """
+        Returns True if the focal plane is configured well enough for set_roi().
+        Binning and amplifier counts are divisors in the ROI calculation.
+        """
+
+        focalplane = self.image.focalplane
+
+        return (
+            min(
+                focalplane.col_bin,
+                focalplane.row_bin,
+                focalplane.numamps_x,
+                focalplane.numamps_y,
+                focalplane.num_ser_amps_det,
+                focalplane.num_par_amps_det,
+            )
+            > 0
+        )
+
     def get_roi(self, roi_num=0):
         """
         Returns a list of the ROI parameters for the roi_num specified.
@@ -1395,9 +1391,14 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         Set the detector gaps in pixels.
         """
 
-        for i, gap in enumerate(det_gap):
-            self.image.focalplane.gapx[i] = gap[0]
-            self.image.focalplane.gapy[i] = gap[1]
+        gaps = numpy.asarray(det_gap)
+        if gaps.size == 0:
+            return
+
+        focalplane = self.image.focalplane
+        count = len(gaps)
+        focalplane.gapx[0:count] = gaps[:, 0]
+        focalplane.gapy[0:count] = gaps[:, 1]
 
         return
 
@@ -1406,9 +1407,14 @@ class Exposure(Tools, Filename, ObjectHeaderMethods):
         Set the detector positions.
         """
 
-        for i, pos in enumerate(det_position):
-            self.image.focalplane.detpos_x[i] = pos[0]
-            self.image.focalplane.detpos_y[i] = pos[1]
+        positions = numpy.asarray(det_position)
+        if positions.size == 0:
+            return
+
+        focalplane = self.image.focalplane
+        count = len(positions)
+        focalplane.detpos_x[0:count] = positions[:, 0]
+        focalplane.detpos_y[0:count] = positions[:, 1]
 
         return
 
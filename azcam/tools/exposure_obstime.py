@@ -38,19 +38,19 @@ class ObsTime(object):
             self.time_zone.append("")
             self.time_system.append("")
 
-        # get current time and date
-        gmt = time.gmtime()
-        self.utc[index] = str(gmt[0]) + time.strftime("-%m-%d", gmt)
+        # get current time and date from a single clock reading
+        t = time.time()
+        gmt = time.gmtime(t)
+        self.utc[index] = time.strftime("%Y-%m-%d", gmt)
 
         self.date[index] = self.utc[index]
 
-        t = time.time()
-        fracsec = int(1000 * round(t - int(t), 3))
+        fracsec = int((t % 1) * 1000)
         self.ut[index] = time.strftime("%H:%M:%S.", gmt) + "%.3u" % fracsec
 
         self.time_zone[index] = time.timezone / 3600
 
-        self.local_time[index] = time.strftime("%H:%M:%S", time.localtime())
+        self.local_time[index] = time.strftime("%H:%M:%S", time.localtime(t))
 
         self.time_system[index] = "UTC"
 
@@ -2,6 +2,8 @@
 Contains the CameraServerInterface class for Magelllan controllers.
 """
 
+import shlex
+
 import azcam
 import azcam.exceptions
 import azcam.sockets
@@ -17,10 +19,15 @@ class CameraServerInterface(object):
         self.host = ""
         self.port = 0
 
+        # one connection is kept open and reused for all commands
         self.socketserver = azcam.sockets.SocketInterface(host, port)
+        self.socketserver.reopen = 1
 
         self.demo_mode = 0
 
+        # number of replies not yet read for commands sent without waiting
+        self.pending_replies = 0
+
     def set_server(self, host: str, port: int = 2405) -> None:
         """
         Set host and port of controller server.
@@ -34,21 +41,87 @@ class CameraServerInterface(object):
 
         return
 
-    def command(self, command: str, terminator: str = "\n"):
+    def command(self, command: str, terminator: str = "\n", wait_reply: bool = True):
         """
         Command method for controller server.
+        If wait_reply is False, returns without waiting for the reply, which is
+        read and discarded before the next command.
         """
 
         if self.demo_mode:
             reply = ["DEMO", 0]
         else:
             try:
-                reply = self.socketserver.command(command, terminator)
-                return reply
-            except Exception as e:
+                replies = self.command_batch([command], terminator, wait_reply)
+                return replies[0] if wait_reply else None
+            except azcam.exceptions.AzcamError as e:
                 if e.error_code == 2:
                     raise azcam.exceptions.AzcamError("Could not connect to camserver")
 
+    def command_batch(
+        self, commands: list, terminator: str = "\n", wait_reply: bool = True
+    ) -> list:
+        """
+        Send several commands to the controller server in a single write.
+        Returns a list of tokenized replies, one for each command, or an empty
+        list if wait_reply is False.
+        """
+
+        if self.demo_mode:
+            return [["DEMO", 0] for _ in commands]
+
+        # a bare terminator would get a reply which is never read
+        if not commands:
+            return []
+
+        with self.socketserver.lock:
+            if not self.socketserver.open():
+                raise azcam.exceptions.AzcamError(
+                    "Could not connect to camserver", error_code=2
+                )
+
+            try:
+                self.drain_replies()
+                self.socketserver.send(terminator.join(commands), terminator)
+
+                if not wait_reply:
+                    self.pending_replies = len(commands)
+                    return []
+                lines = self.recv_lines(len(commands))
+            except OSError:
+                # drop a broken connection so the next command reconnects
+                self.socketserver.close()
+                self.pending_replies = 0
+                raise
+
+        return [shlex.split(line) for line in lines]
+
+    def drain_replies(self) -> None:
+        """
+        Read and discard replies to commands which were sent without waiting.
+        The caller must hold the socket lock.
+        """
+
+        if self.pending_replies:
+            for line in self.recv_lines(self.pending_replies):
+                if line.startswith("ERROR"):
+                    azcam.exceptions.warning(f"camserver: {line}")
+            self.pending_replies = 0
+
+        return
+
+    def recv_lines(self, count: int) -> list:
+        """
+        Receive count reply lines from the controller server.
+        """
+
+        lines = []
+        while len(lines) < count:
+            reply = self.socketserver.recv_line()
+            lines.extend(line.rstrip("\r") for line in reply.split("\n"))
+
+        return lines
+
     def test(self):
         """
         Echo a message string from controller server.
@@ -63,23 +136,38 @@ class CameraServerInterface(object):
 
         return self.command('Echo "' + str(Message) + '"')
 
-    def upload_file(self, fbuffer):
+    def upload_file(self, fbuffer: bytes):
         """
         Sends a file as a binary buffer to the ControllerServer to be written to its file system.
         Returns the name of the file on the ControllerServer file system.
         """
 
-        # send size
-        size = len(fbuffer)
-        self.command("cmd UploadFile " + str(size))
+        if self.demo_mode:
+            return ""
 
-        # send file buffer
-        if not self.demo_mode:
-            self.socketserver.send(fbuffer)
-            reply = self.socketserver.recv()
-            csfilename = reply.split(" ")[1]
-        else:
-            csfilename = ""
+        # the whole exchange holds the lock so no other command can interleave
+        with self.socketserver.lock:
+            if not self.socketserver.open():
+                raise azcam.exceptions.AzcamError("Could not connect to camserver")
+
+            try:
+                self.drain_replies()
+
+                # send size
+                size = len(fbuffer)
+                self.socketserver.send("cmd UploadFile " + str(size))
+                self.recv_lines(1)
+
+                # send file buffer
+                self.socketserver.send(fbuffer)
+                reply = self.socketserver.recv_line()
+            except OSError:
+                # drop a broken connection so the next command reconnects
+                self.socketserver.close()
+                self.pending_replies = 0
+                raise
+
+        csfilename = reply.split(" ")[1]
 
         return csfilename.strip()
 
@@ -102,12 +190,14 @@ class CameraServerInterface(object):
 
         return self.command("cmd DeleteFile " + filename)
 
-    def set(self, Parameter, value):
+    def set(self, Parameter, value, wait_reply=True):
         """
         Set a parameter in the controller server.
         """
 
-        return self.command("Set " + Parameter + " " + str(value))
+        return self.command(
+            "Set " + Parameter + " " + str(value), wait_reply=wait_reply
+        )
 
     def get(self, Parameter):
         """
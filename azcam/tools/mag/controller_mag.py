@@ -3,6 +3,7 @@ Contains the ControllerMag class.
 """
 
 import os
+import pathlib
 import time
 
 import azcam
@@ -50,6 +51,19 @@ class ControllerMag(Controller):
 
         self.camserver = CameraServerInterface()
 
+        # exposure tool, looked up on first use
+        self.exposure_tool = None
+
+        # ControllerType reply from the controller server, None until initialized
+        self.server_controller_type = None
+
+        # exposure time last written to the controller (msec), -1 if unknown
+        self.last_et_msec = -1
+
+        # ROI setup commands and the detpars values they were built from
+        self.roi_commands = []
+        self.roi_key = None
+
     def reset(self):
         """
         Reset controller.
@@ -58,38 +72,46 @@ class ControllerMag(Controller):
 
         # reset flag even is system has previously been reset
         self.is_reset = 0
+        self.last_et_msec = -1
 
         # close and open PCI interface every time
         self.camserver.command("CloseInterface")  # don't stop if error here
+        self.server_controller_type = None
 
         azcam.log("Resetting interface")
         self.camserver.command("OpenInterface mag1")
 
-        self.header.delete_all_keywords()
-
+        # DSP reset takes 1.6 secs, the DSP file is uploaded while waiting
         azcam.log("Waiting for DSP reset")
-        time.sleep(1.6)
+        dsp_ready = time.monotonic() + 1.6
+
+        self.header.delete_all_keywords()
 
         azcam.log("Loading DSP file %s" % self.timing_file)
 
         try:
-            self.upload_dsp_file(2, self.timing_file)
+            self.upload_dsp_file(2, self.timing_file, dsp_ready)
         except azcam.exceptions.AzcamError as e:
             # warn about reset
             if e.error_code == 1:
                 azcam.exceptions.warning("Controller not reset: check power")
                 return
 
+        # wait for FPGA reset (104 ms)
+        fpga_ready = time.monotonic() + 0.1
+
         self.remove_read_lock()
 
-        # wait for FPGA reset (104 ms)
-        time.sleep(0.1)
+        time.sleep(max(fpga_ready - time.monotonic(), 0))
 
         self.is_reset = 1
 
         self.set_roi()
 
-        self.set_exposuretime(azcam.db.tools["exposure"].exposure_time)
+        exposure = self.exposure_tool
+        if exposure is None:
+            exposure = self.exposure_tool = azcam.db.tools["exposure"]
+        self.set_exposuretime(exposure.exposure_time)
 
         self.set_read_lock()
 
@@ -105,15 +127,19 @@ class ControllerMag(Controller):
         Initialize the controller interface.
         """
 
-        reply = self.camserver.get("ControllerType")
-        if reply[0] == "OK":
-            if reply[1] == "0" or reply[1].lower() == "demo":
-                azcam.log("ControllerServer running in DEMO mode")
-            self.is_initialized = True
+        # controller type does not change while the interface is open
+        if self.is_initialized and self.server_controller_type is not None:
             return
-        else:
+
+        reply = self.camserver.get("ControllerType")
+        if reply[0] != "OK":
             raise azcam.exceptions.AzcamError("Could not initialize controller")
 
+        self.server_controller_type = reply[1]
+        if reply[1] == "0" or reply[1].lower() == "demo":
+            azcam.log("ControllerServer running in DEMO mode")
+        self.is_initialized = True
+
         return
 
     def set_read_lock(self, Flag=-1):
@@ -156,48 +182,42 @@ class ControllerMag(Controller):
         Sets the ROI parameters values in the controller based on focalplane parameters.
         Sends parameters to the controller.
         """
+        # parameters are only sent to a controller which has been reset
+        if not self.is_reset:
+            return
+
         # send parameters to controller in order to do all hardware communication here
-        if self.is_reset:
-            cmd = (
-                "SetFormat "
-                + str(self.detpars.ns_total)
-                + " "
-                + str(self.detpars.ns_predark)
-                + " "
-                + str(self.detpars.ns_underscan)
-                + " "
-                + str(self.detpars.ns_overscan)
-                + " "
-                + str(self.detpars.np_total)
-                + " "
-                + str(self.detpars.np_predark)
-                + " "
-                + str(self.detpars.np_underscan)
-                + " "
-                + str(self.detpars.np_overscan)
-                + " "
-                + str(self.detpars.np_frametransfer)
-            )
-            self.camserver.command(cmd)
-
-            self.camserver.command(
-                "SetRoi "
-                + str(self.detpars.first_col)
-                + " "
-                + str(self.detpars.last_col)
-                + " "
-                + str(self.detpars.first_row)
-                + " "
-                + str(self.detpars.last_row)
-                + " "
-                + str(self.detpars.col_bin)
-                + " "
-                + str(self.detpars.row_bin)
-            )
-
-        # update ControllerServer for image size
-        if self.is_reset:
-            self.camserver.set("NumberPixelsImage", self.detpars.numpix_image)
+        d = self.detpars
+
+        # rebuild the commands only when detpars have changed
+        key = (
+            d.ns_total,
+            d.ns_predark,
+            d.ns_underscan,
+            d.ns_overscan,
+            d.np_total,
+            d.np_predark,
+            d.np_underscan,
+            d.np_overscan,
+            d.np_frametransfer,
+            d.first_col,
+            d.last_col,
+            d.first_row,
+            d.last_row,
+            d.col_bin,
+            d.row_bin,
+            d.numpix_image,
+        )
+        if key != self.roi_key:
+            self.roi_commands = [
+                "SetFormat " + " ".join(map(str, key[:9])),
+                "SetRoi " + " ".join(map(str, key[9:15])),
+                f"Set NumberPixelsImage {d.numpix_image}",
+            ]
+            self.roi_key = key
+
+        # format, ROI, and image size for ControllerServer in one write
+        self.camserver.command_batch(self.roi_commands)
 
         return
 
@@ -209,6 +229,8 @@ class ControllerMag(Controller):
 
         for _ in range(Cycles):
             reply = self.magio("flush_ccd", 0)
+            if not reply or reply[0] not in ("OK", "DEMO"):
+                raise azcam.exceptions.AzcamError("Controller flush failed")
 
         return
 
@@ -220,7 +242,7 @@ class ControllerMag(Controller):
         close -> open shutter during exposure
         """
 
-        self.camserver.set("ShutterState", Flag)
+        self.camserver.set("ShutterState", Flag, wait_reply=False)
 
         return
 
@@ -269,34 +291,35 @@ class ControllerMag(Controller):
         """
 
         if state:
-            self.magio("set_shutter", 1)
+            self.magio("set_shutter", 1, wait_reply=False)
         else:
-            self.magio("set_shutter", 0)
+            self.magio("set_shutter", 0, wait_reply=False)
 
         return
 
     # *** files ***
 
-    def upload_dsp_file(self, BoardNumber, filename):
+    def upload_dsp_file(self, BoardNumber, filename, ready_time=0.0):
         """
         Sends DSP a file to a controllercontaining DSP code to the PCI, timing, or utility boards.
+        ready_time is the time.monotonic() value after which a reset in progress is finished.
         """
 
         csfile = self.upload_file(filename)
 
         # wait for reset
-        time.sleep(1)
+        time.sleep(max(ready_time - time.monotonic(), 0) + 1)
 
-        self.load_file(BoardNumber, csfile)
+        self.camserver.load_file(BoardNumber, csfile)
 
-        # set keyword for file loaded
+        # set keyword for file loaded, once
         if BoardNumber == 2:
-            self.header.set_keyword(
-                "DSPFILE",
-                os.path.basename(filename),
-                "Timing board DSP code filename",
-                "str",
-            )
+            dspfile = os.path.basename(filename)
+            comment = "Timing board DSP code filename"
+        else:
+            dspfile = os.path.basename(csfile)
+            comment = "DSP code filename"
+        self.header.set_keyword("DSPFILE", dspfile, comment, "str")
 
         return
 
@@ -325,7 +348,19 @@ class ControllerMag(Controller):
 
         et_msec = int(ExposureTime * 1000)
 
-        return self.camserver.set("ExposureTime", et_msec)
+        # skip the round trip when the controller already has this value
+        if et_msec == self.last_et_msec:
+            return
+
+        reply = self.camserver.set("ExposureTime", et_msec)
+
+        # only remember values the controller accepted
+        if reply and reply[0] in ("OK", "DEMO"):
+            self.last_et_msec = et_msec
+        else:
+            self.last_et_msec = -1
+
+        return reply
 
     def get_exposuretime(self):
         """
@@ -344,9 +379,10 @@ class ControllerMag(Controller):
         reply = self.camserver.get("ExposureTimeRemaining")
         elapsed = int(reply[1])  # milliseconds
         print(elapsed)
-        return (
-            max(0, azcam.db.tools["exposure"].exposure_time * 1000 - elapsed) / 1000.0
-        )
+        exposure = self.exposure_tool
+        if exposure is None:
+            exposure = self.exposure_tool = azcam.db.tools["exposure"]
+        return max(0, exposure.exposure_time * 1000 - elapsed) / 1000.0
 
     # *** readout ***
 
@@ -369,11 +405,13 @@ class ControllerMag(Controller):
 
     # *** misc ***
 
-    def magio(self, Command, Parameter):
+    def magio(self, Command, Parameter, wait_reply=True):
         """
         Issue a low-level MAG controller IO on the controller server.
         """
-        return self.camserver.command("MagIO " + str(Command) + " " + str(Parameter))
+        return self.camserver.command(
+            f"MagIO {Command} {Parameter}", wait_reply=wait_reply
+        )
 
     def start_exposure(self):
         """
@@ -393,13 +431,13 @@ class ControllerMag(Controller):
         """
         Abort a readout in progress.
         """
-        return self.camserver.command("AbortReadout")
+        return self.camserver.command("AbortReadout", wait_reply=False)
 
     def exposure_pause(self):
         """
         Pause an integration which is in progress.
         """
-        return self.camserver.command("PauseExposure")
+        return self.camserver.command("PauseExposure", wait_reply=False)
 
     def read_image(self):
         """
@@ -411,14 +449,14 @@ class ControllerMag(Controller):
         """
         Resume a paused integration.
         """
-        return self.camserver.command("ResumeExposure")
+        return self.camserver.command("ResumeExposure", wait_reply=False)
 
     def write_image(self, flag, file):
         """
         Write image to local disk on controller server.
         """
 
-        return self.camserver.command("WriteImage " + str(flag) + " " + file)
+        return self.camserver.command(f"WriteImage {flag} {file}")
 
     def set_configuration(self, Flag, Splits, numdet_x, numdet_y, amp_cfg):
         """
@@ -426,16 +464,7 @@ class ControllerMag(Controller):
         """
 
         return self.camserver.command(
-            "SetConfiguration "
-            + str(Flag)
-            + " "
-            + str(Splits)
-            + " "
-            + str(numdet_x)
-            + " "
-            + str(numdet_y)
-            + " "
-            + str(amp_cfg)
+            f"SetConfiguration {Flag} {Splits} {numdet_x} {numdet_y} {amp_cfg}"
         )
 
     # *** files ***
@@ -446,8 +475,7 @@ class ControllerMag(Controller):
         Returns uploaded filename on controller server.
         """
 
-        with open(filename, "r") as f:
-            fbuffer = f.read()
+        fbuffer = pathlib.Path(filename).read_bytes()
 
         # send file as binary, reply is filename on controller server
         reply = self.camserver.upload_file(fbuffer)
@@ -51,6 +51,7 @@ class ExposureMag(Exposure):
 
         # Mag controller pause/resume not supported but abort is
         if self.exposure_time >= 1.0:
+            exposure_end = time.monotonic() + self.exposure_time_remaining
             while self.exposure_time_remaining > 0.15:
                 if self.exposure_flag == self.exposureflags["ABORT"]:
                     if self.is_exposure_sequence:
@@ -61,8 +62,10 @@ class ExposureMag(Exposure):
                     else:
                         azcam.db.tools["controller"].exposure_abort()
                     break
-                time.sleep(0.1)
-                self.exposure_time_remaining = self.exposure_time_remaining - 0.1
+                # wakes early on abort
+                self.flag_event.wait(0.1)
+                self.flag_event.clear()
+                self.exposure_time_remaining = exposure_end - time.monotonic()
         else:
             time.sleep(self.exposure_time)
 
@@ -1,3 +1,4 @@
+import select
 import socket
 import time
 
@@ -5,6 +6,7 @@ import numpy
 
 import azcam
 import azcam.exceptions
+import azcam.utils
 
 
 class ReceiveData(object):
@@ -12,29 +14,34 @@ class ReceiveData(object):
     Exposure subclass to receive image data.
     """
 
+    # images with more amplifiers than this are deinterlaced in parallel
+    PARALLEL_DEINTERLACE_AMPS = 4
+
     def __init__(self, exposure):
 
         self.exposure = exposure  # upper level exposure object
 
-        self.DeinterlaceParams = ""
-        self.port = 0
         self.is_valid = 1
 
         self.PixelsReadout = 0
         self.pixels_remaining = 0
-        self.pixels_remaining = 0
-        self.camserver = 0
-        self.socket = 0
+        # image data connection to controller server, kept open between readouts
+        self.socket = None
 
-        # Deinterlace mode
-        self.deinterlace_mode = 1
         # Number of pixels per amplifier
         self.numpix_amp = 0
         # Number of amplifiers
         self.numamps_image = 0
 
         # using this helps writing efficiency, bytes
-        self.RecBufferSize = 5 * 1024 * 1024
+        # also used as the socket receive buffer size
+        self.RecBufferSize = 16 * 1024 * 1024
+        # data frame size header (%16d + space)
+        self.header_buffer = bytearray(17)
+        # temporary image buffer, reused while large enough
+        self.buffer_temp = None
+        # demo mode amplifier data
+        self.mock_ramp = None
 
     def receive_image_data(self, dataSize):
         """
@@ -47,15 +54,8 @@ class ReceiveData(object):
             self.mock_data()
             return
 
-        # create a new socket for binary data and connect to the controller server
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-
-        self.socket.connect(
-            (
-                azcam.db.tools["controller"].camserver.host,
-                azcam.db.tools["controller"].camserver.port,
-            )
-        )
+        # connect to the controller server for binary data if needed
+        self.open_socket()
 
         azcam.log(f"Receiving image data: {dataSize} bytes", level=3)
 
@@ -67,70 +67,92 @@ class ReceiveData(object):
             dataSize - 17, self.RecBufferSize - 17
         )  # 17 bytes for the data frame size (%16d + space)
         dataCnt = 0  # receved data counter
-        repCnt = 0  # repeate data request counter: 100
-        getData = b""
+        # give up when no data has arrived for this long, seconds
+        waitTimeout = 10.0
+        waitDeadline = time.monotonic() + waitTimeout
+        # delay between empty data requests, doubled up to 0.2 seconds
+        waitDelay = 0.01
         totalpixels = int(dataSize / 2)
         self.PixelsReadout = 0
         self.pixels_remaining = totalpixels
 
+        # a single amplifier needs no deinterlace so receive directly into image
+        image_data = self.exposure.image.data
+        direct = (
+            self.numamps_image == 1
+            and len(self.exposure.data_order) == 0
+            and image_data.flags.c_contiguous
+            and image_data.dtype == numpy.dtype("<u2")
+        )
+
         # create temporary image buffer
-        BufferTemp = numpy.empty(shape=(self.exposure.image.data.size), dtype="<u2")
+        if direct:
+            BufferTemp = image_data.reshape(-1)
+        else:
+            size = image_data.size
+            if self.buffer_temp is None or self.buffer_temp.size < size:
+                self.buffer_temp = numpy.empty(shape=(size), dtype="<u2")
+            BufferTemp = self.buffer_temp[:size]
+
+        # byte view of the buffer so data is received in place
+        BufferBytes = memoryview(BufferTemp).cast("B")
 
-        # set image data pointer
+        # set image data pointer, bytes
         ptrData = 0
 
+        # bind for the loop
+        exposure = self.exposure
+        abort_flag = exposure.exposureflags["ABORT"]
+        request_data = self.request_data
+        log_progress = azcam.db.verbosity >= 3
+
         # loop over data just read, long repeat as images could be slow to start
-        while (dataCnt < dataSize) and (repCnt < 50):
+        try:
+            while (dataCnt < dataSize) and (time.monotonic() < waitDeadline):
 
-            # check if aborted by user (from abort() - controller.abort()
-            if (
-                azcam.db.tools["exposure"].exposure_flag
-                == azcam.db.tools["exposure"].exposureflags["ABORT"]
-            ):
+                # check if aborted by user (from abort() - controller.abort()
+                if exposure.exposure_flag == abort_flag:
 
-                # if in a sequence then let this readout finish
-                if self.exposure.is_exposure_sequence:
-                    pass  # return will not be an error
+                    # if in a sequence then let this readout finish
+                    if exposure.is_exposure_sequence:
+                        pass  # return will not be an error
+                    else:
+                        # break out of read loop
+                        azcam.db.tools[
+                            "controller"
+                        ].readout_abort()  # stop ControllerServer
+                        break
+
+                # request data + 17 bytes for data length
+                len1 = request_data(reqCnt + 17, BufferBytes[ptrData:])
+                if log_progress:
+                    azcam.log(
+                        f"Readout: {self.pixels_remaining:10d} pixels remaining",
+                        level=3,
+                    )
+
+                if len1 != 0:
+                    dataCnt += len1
+                    waitDeadline = time.monotonic() + waitTimeout
+                    waitDelay = 0.01
+
+                    # store data
+                    pixelsreadout = int(
+                        len1 / 2
+                    )  # number pixels in this read now available
+
+                    ptrData = ptrData + len1
+
+                    reqCnt = min(dataSize - dataCnt - 17, self.RecBufferSize - 17)
+                    self.PixelsReadout = self.PixelsReadout + pixelsreadout
+                    self.pixels_remaining = self.pixels_remaining - pixelsreadout
                 else:
-                    # break out of read loop
-                    azcam.db.tools[
-                        "controller"
-                    ].readout_abort()  # stop ControllerServer
-                    break
-
-            getData = self.request_data(
-                reqCnt + 17
-            )  # request data + 17 bytes for data length
-            len1 = len(getData)
-            azcam.log(f"Readout: {self.pixels_remaining:10d} pixels remaining", level=3)
-
-            if len1 != 0:
-                dataCnt += len1
-                repCnt = 0
-
-                # store data
-                pixelsreadout = int(
-                    len1 / 2
-                )  # number pixels in this read now available
-
-                # convert received data to unsigned shorts
-                ImageBufferTemp = numpy.ndarray(
-                    shape=(1, pixelsreadout), dtype="<u2", buffer=getData
-                )
-
-                # copy the data into TempBuffer
-                BufferTemp[ptrData : ptrData + pixelsreadout] = ImageBufferTemp[
-                    0:pixelsreadout
-                ]
-                ptrData = ptrData + pixelsreadout
-
-                reqCnt = min(dataSize - dataCnt - 17, self.RecBufferSize - 17)
-                self.PixelsReadout = self.PixelsReadout + pixelsreadout
-                self.pixels_remaining = self.pixels_remaining - pixelsreadout
-                # time.sleep(0.2)
-            else:
-                time.sleep(0.2)
-                repCnt = repCnt + 1
+                    time.sleep(waitDelay)
+                    waitDelay = min(waitDelay * 2, 0.2)
+        except Exception:
+            # connection state is unknown after an error
+            self.close_socket()
+            raise
 
         # check if all data has been received
         if dataCnt == dataSize:
@@ -146,95 +168,164 @@ class ReceiveData(object):
                     dataCnt,
                     dataSize,
                 )
-                self.socket.close()
+                self.close_socket()
                 raise azcam.exceptions.AzcamError(s)
             else:
-                self.socket.close()
+                self.close_socket()
                 raise azcam.exceptions.AzcamError(
                     "Aborted in receive_image_data", error_code=3
                 )
-        self.socket.close()
+
+        if direct:
+            return
 
         # deinterlace into exposure.image.data
         BufferTemp = BufferTemp.reshape(self.numpix_amp, self.numamps_image)
 
-        if len(self.exposure.data_order) == 0:
-            for AmpPos in range(0, self.numamps_image):
-                self.exposure.image.data[AmpPos, 0 : self.numpix_amp] = BufferTemp[
-                    0 : self.numpix_amp, AmpPos
-                ]
+        if self.numamps_image > self.PARALLEL_DEINTERLACE_AMPS:
+            self.deinterlace_parallel(BufferTemp)
+        elif len(self.exposure.data_order) == 0:
+            # one strided numpy copy for all amplifiers
+            self.exposure.image.data[:, 0 : self.numpix_amp] = BufferTemp.T
         else:
-            indx = 0
-            for item in self.exposure.data_order:
-                self.exposure.image.data[indx, 0 : self.numpix_amp] = BufferTemp[
-                    0 : self.numpix_amp, item
-                ]
-                indx += 1
+            numamps = len(self.exposure.data_order)
+            self.exposure.image.data[0:numamps, 0 : self.numpix_amp] = BufferTemp[
+                :, self.exposure.data_order
+            ].T
 
         return
 
-    def request_data(self, datacnt):
+    def deinterlace_parallel(self, BufferTemp):
+        """
+        Deinterlace BufferTemp into exposure.image.data with one copy per amplifier.
+        numpy releases the GIL for large copies so amplifiers are copied in parallel.
+        """
+
+        data = self.exposure.image.data
+        numpix_amp = self.numpix_amp
+        data_order = self.exposure.data_order
+        if len(data_order) == 0:
+            data_order = range(self.numamps_image)
+
+        def copy_amp(indx):
+            data[indx, 0:numpix_amp] = BufferTemp[:, data_order[indx]]
+
+        # list() waits for all copies and raises any copy error
+        # separate from the exposure pool, which may be running this readout
+        executor = azcam.utils.get_executor("deinterlace", 4)
+        list(executor.map(copy_amp, range(len(data_order))))
+
+        return
+
+    def open_socket(self):
+        """
+        Open the image data connection to controller server unless already open.
+        """
+
+        # an idle connection is readable only if closed by the server
+        if self.socket is not None and select.select([self.socket], [], [], 0)[0]:
+            self.close_socket()
+
+        if self.socket is not None:
+            return
+
+        camserver = azcam.db.tools["controller"].camserver
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # set before connect so the TCP window can scale to a full data frame
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RecBufferSize)
+        # send small data requests immediately
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        try:
+            self.socket.connect((camserver.host, camserver.port))
+        except OSError:
+            self.close_socket()
+            raise
+
+        return
+
+    def close_socket(self):
+        """
+        Close the image data connection to controller server.
+        """
+
+        if self.socket is not None:
+            try:
+                self.socket.close()
+            except Exception:
+                pass  # never error on close
+        self.socket = None
+
+        return
+
+    def request_data(self, datacnt, view):
+        """
+        Request a data frame from controller server and receive it into view.
+        datacnt is the requested size in bytes including the 17 byte size header.
+        Returns the number of data bytes received, 0 if none.
+        An incomplete frame closes the connection, so the rest of it is never read
+        as the start of another frame.
+        """
+
+        # reconnect if the connection was closed after an earlier failure
+        if self.socket is None:
+            self.open_socket()
 
         request = "GetImageData " + str(datacnt) + "\n"
         self.socket.send(str.encode(request))
 
-        loop = 1
         rptCnt = 10
-        data = b""
-        gotCnt = 0
-        dataFrame = b""
-        oneFrame = b""
-        cntFrame = 0
-
-        datacnt += 17
-        while (loop == 1) and (rptCnt > 0):
-            oneFrame = self.socket.recv(datacnt)
-            if len(oneFrame) > 0:
-                dataFrame += oneFrame
-                cntFrame += 1
-
-                if gotCnt == 0:
-                    if len(dataFrame) >= 17:
-                        dataCnt = int(dataFrame[0:16])
-                        if dataCnt > 0:
-                            data += dataFrame[17:]
-                            if dataCnt == len(dataFrame[17:]):
-                                gotCnt = 0
-                                loop = 0
-                            else:
-                                dataFrame = dataFrame[17:]
-                                datacnt = datacnt - 17 - len(dataFrame[17:])
-                                gotCnt = 1
-                        else:
-                            loop = 0
-                            data = ""
-                    else:
-                        datacnt = datacnt - len(dataFrame)
-                        rptCnt -= 1
-                else:
-                    if dataCnt == len(dataFrame):
-                        data = dataFrame
-                        loop = 0
 
-            else:  # time out: received no data
+        # read data frame size header
+        header = memoryview(self.header_buffer)
+        gotCnt = 0
+        while gotCnt < 17:
+            cnt = self.socket.recv_into(header[gotCnt:])
+            if cnt == 0:  # time out: received no data
                 rptCnt -= 1
+                if rptCnt == 0:
+                    self.close_socket()
+                    if gotCnt == 0:
+                        return 0
+                    raise azcam.exceptions.AzcamError("Incomplete data frame header")
+            gotCnt += cnt
+
+        dataCnt = int(self.header_buffer[0:16])
+        if dataCnt <= 0:
+            return 0
+        if dataCnt > len(view):
+            raise azcam.exceptions.AzcamError(
+                f"Received data frame of {dataCnt} bytes exceeds image size"
+            )
 
-        if rptCnt == 0:
-            data = ""
+        # read data frame directly into view
+        gotCnt = 0
+        while gotCnt < dataCnt:
+            cnt = self.socket.recv_into(view[gotCnt:dataCnt])
+            if cnt == 0:  # time out: received no data
+                rptCnt -= 1
+                if rptCnt == 0:
+                    self.close_socket()
+                    raise azcam.exceptions.AzcamError(
+                        f"Incomplete data frame: received {gotCnt} of {dataCnt} bytes"
+                    )
+            gotCnt += cnt
 
-        return data
+        return dataCnt
 
     def mock_data(self):
         """
         Generate mock data for demo mode.
         """
 
-        ix = self.exposure.image.focalplane.numcols_image
-        iy = self.exposure.image.focalplane.numrows_image
+        focalplane = self.exposure.image.focalplane
+        numamps = focalplane.numamps_image
+        numpix = int(focalplane.numrows_image * focalplane.numcols_image / numamps)
 
-        for AmpPos in range(azcam.db.tools["exposure"].image.focalplane.numamps_image):
-            self.exposure.image.data[AmpPos] = numpy.linspace(
-                0, 65355, int(iy * ix / self.exposure.image.focalplane.numamps_image)
-            )
+        # same ramp for every amplifier, rebuilt only when size changes
+        if self.mock_ramp is None or self.mock_ramp.size != numpix:
+            self.mock_ramp = numpy.linspace(0, 65355, numpix)
+        self.exposure.image.data[0:numamps] = self.mock_ramp
 
         return
@@ -40,6 +40,10 @@ class Tools(object):
         #: verbosity for debug, >0 is more verbose
         self.verbosity = 0
 
+        #: 1 when update_header() shares no connection with other tools,
+        #: so it may run concurrently with other header updates
+        self.header_update_concurrent: int = 0
+
         # save tool name
         azcam.db.tools.update({self.tool_id: self})
 
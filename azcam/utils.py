@@ -5,9 +5,10 @@
 import os
 import shlex
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
-
 # keyboard checking is optional
 try:
     import msvcrt
@@ -17,6 +18,10 @@ except Exception:
 import azcam
 import azcam.exceptions
 
+# shared worker thread pools by name, created on first use
+_executors = {}
+_executors_lock = threading.Lock()
+
 
 def curdir(folder: str = "") -> str:
     """
@@ -439,3 +444,25 @@ def quoter(input: str) -> str:
         output = f'"{input}"'
 
     return output
+
+
+def get_executor(name: str, max_workers: int = 4) -> ThreadPoolExecutor:
+    """
+    Return the shared worker thread pool called name, creating it on first use.
+
+    Args:
+        name: name of the pool, also used for its thread names.
+        max_workers: number of worker threads when the pool is created.
+    Returns:
+        the thread pool executor.
+    """
+
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"azcam-{name}"
+            )
+            _executors[name] = executor
+
+    return executor